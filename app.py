@@ -5,6 +5,7 @@ Deploy the TradingAgents framework as a REST API service
 """
 
 import os
+import re
 import logging
 from flask import Flask, jsonify, request
 from datetime import datetime
@@ -30,6 +31,9 @@ ta_graph = None
 # Global progress tracking
 analysis_progress = {}
 
+# Shape of a caller-supplied analysis ID: <symbol>_<YYYY-MM-DD>_<8 hex digits>, as built by dashboard.py
+ANALYSIS_ID_PATTERN = re.compile(r'[A-Z0-9.^=\-]{1,15}_\d{4}-\d{2}-\d{2}_[0-9a-f]{8}')
+
 def clean_analysis_result(result):
     """Extract clean, readable text from LangChain analysis results"""
     if not result:
@@ -217,9 +221,16 @@ def analyze_stock():
         
         logger.info(f"🔍 Analyzing {symbol} for date {date}")
         
-        # Initialize progress tracking for this analysis
-        analysis_id = f"{symbol}_{date}_{datetime.now().strftime('%H%M%S')}"
-        analysis_progress[analysis_id] = {
+        # Initialize progress tracking for this analysis (the dashboard may supply the ID)
+        analysis_id = data.get('analysis_id')
+        if analysis_id is not None and not ANALYSIS_ID_PATTERN.fullmatch(str(analysis_id)):
+            return jsonify({
+                "error": "Invalid analysis ID",
+                "message": "analysis_id must look like SYMBOL_YYYY-MM-DD_<8 hex digits>.",
+                "analysis_id": analysis_id
+            }), 400
+        analysis_id = analysis_id or f"{symbol}_{date}_{datetime.now().strftime('%H%M%S')}"
+        progress_entry = {
             "symbol": symbol,
             "date": date,
             "status": "starting",
@@ -229,6 +240,14 @@ def analyze_stock():
             "started_at": datetime.now().isoformat(),
             "messages": ["🚀 Starting multi-agent analysis..."]
         }
+        # setdefault claims the ID atomically, so an existing run (or a completed one that
+        # backs history and downloads) is never overwritten
+        if analysis_progress.setdefault(analysis_id, progress_entry) is not progress_entry:
+            return jsonify({
+                "error": "Analysis already exists",
+                "message": f"An analysis with ID {analysis_id} already exists.",
+                "analysis_id": analysis_id
+            }), 409
         
         # Update progress - Starting analysis
         analysis_progress[analysis_id]["status"] = "analyzing"
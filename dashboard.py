@@ -5,1593 +5,691 @@ Interactive web interface for the TradingAgents multi-agent system
 """
 
 import os
-import requests
-import json
-from datetime import datetime
-from flask import Flask, render_template_string, request, jsonify, redirect, url_for
+import re
+import gzip
+import brotli
+import rcssmin
+import rjsmin
+from pathlib import Path
+import httpx
+import hashlib
+import orjson
+from cachetools import TTLCache
+from flask import Flask, request, Response, abort, redirect
+from flask.json.provider import DefaultJSONProvider
 import threading
 import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+# Datetimes without tzinfo are treated as UTC; numpy values from the analysis are serialized natively
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (request.get_json(), jsonify(), dict return values)"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Configuration
 TRADINGAGENTS_API_URL = os.getenv("TRADINGAGENTS_API_URL", "https://stock-prediction-model-x5mr.onrender.com")
 DASHBOARD_PORT = int(os.getenv("DASHBOARD_PORT", 8002))
 
-# Global storage for analysis results
-analysis_results = {}
-analysis_status = {}
-
-# HTML Template
-HTML_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>TradingAgents Dashboard</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-            background: rgba(255, 255, 255, 0.95);
-            border-radius: 20px;
-            padding: 30px;
-            box-shadow: 0 20px 40px rgba(0, 0, 0, 0.1);
-        }
-        
-        .header {
-            text-align: center;
-            margin-bottom: 40px;
-            padding-bottom: 20px;
-            border-bottom: 2px solid #e0e0e0;
-        }
-        
-        .header h1 {
-            color: #2c3e50;
-            font-size: 2.5em;
-            margin-bottom: 10px;
-        }
-        
-        .header p {
-            color: #7f8c8d;
-            font-size: 1.2em;
-        }
-        
-        .analysis-form {
-            background: #f8f9fa;
-            padding: 30px;
-            border-radius: 15px;
-            margin-bottom: 30px;
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.1);
-        }
-        
-        .form-group {
-            display: flex;
-            gap: 15px;
-            align-items: center;
-            justify-content: center;
-            flex-wrap: wrap;
-        }
-        
-        .form-group input {
-            padding: 12px 20px;
-            font-size: 16px;
-            border: 2px solid #ddd;
-            border-radius: 8px;
-            outline: none;
-            transition: border-color 0.3s;
-            min-width: 200px;
-        }
-        
-        .form-group input:focus {
-            border-color: #667eea;
-        }
-        
-        .btn {
-            background: linear-gradient(45deg, #667eea, #764ba2);
-            color: white;
-            padding: 12px 30px;
-            border: none;
-            border-radius: 8px;
-            font-size: 16px;
-            cursor: pointer;
-            transition: transform 0.3s, box-shadow 0.3s;
-        }
-        
-        .btn:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(102, 126, 234, 0.4);
-        }
-        
-        .btn:disabled {
-            background: #ccc;
-            cursor: not-allowed;
-            transform: none;
-            box-shadow: none;
-        }
-        
-        .status-section {
-            margin-bottom: 30px;
-        }
-        
-        .status-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            margin-bottom: 20px;
-        }
-        
-        .status-card {
-            background: white;
-            padding: 20px;
-            border-radius: 12px;
-            box-shadow: 0 3px 10px rgba(0, 0, 0, 0.1);
-            border-left: 4px solid #667eea;
-        }
-        
-        .status-card h3 {
-            color: #2c3e50;
-            margin-bottom: 10px;
-        }
-        
-        .status-indicator {
-            display: inline-block;
-            width: 12px;
-            height: 12px;
-            border-radius: 50%;
-            margin-right: 8px;
-        }
-        
-        .status-healthy { background-color: #27ae60; }
-        .status-warning { background-color: #f39c12; }
-        .status-error { background-color: #e74c3c; }
-        
-        .progress-section {
-            margin-bottom: 30px;
-        }
-        
-        .progress-bar {
-            width: 100%;
-            height: 8px;
-            background: #e0e0e0;
-            border-radius: 4px;
-            overflow: hidden;
-            margin-bottom: 20px;
-        }
-        
-        .progress-fill {
-            height: 100%;
-            background: linear-gradient(45deg, #667eea, #764ba2);
-            border-radius: 4px;
-            transition: width 0.5s ease;
-            width: 0%;
-        }
-        
-        .agent-status {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin-bottom: 20px;
-        }
-        
-        .agent-card {
-            background: white;
-            padding: 15px;
-            border-radius: 10px;
-            box-shadow: 0 2px 5px rgba(0, 0, 0, 0.1);
-            text-align: center;
-        }
-        
-        .agent-card.active {
-            border: 2px solid #667eea;
-            background: linear-gradient(135deg, #667eea11, #764ba211);
-        }
-        
-        .results-section {
-            background: white;
-            border-radius: 15px;
-            padding: 30px;
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.1);
-        }
-        
-        .results-section h2 {
-            color: #2c3e50;
-            margin-bottom: 20px;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #e0e0e0;
-        }
-        
-        .decision-card {
-            background: linear-gradient(135deg, #27ae60, #2ecc71);
-            color: white;
-            padding: 25px;
-            border-radius: 12px;
-            margin-bottom: 20px;
-            text-align: center;
-            font-size: 1.3em;
-            font-weight: bold;
-        }
-        
-        .decision-card.sell {
-            background: linear-gradient(135deg, #e74c3c, #c0392b);
-        }
-        
-        .decision-card.hold {
-            background: linear-gradient(135deg, #f39c12, #e67e22);
-        }
-        
-        .analysis-details {
-            background: #f8f9fa;
-            padding: 20px;
-            border-radius: 10px;
-            white-space: pre-wrap;
-            font-family: 'Courier New', monospace;
-            font-size: 0.9em;
-            line-height: 1.4;
-            max-height: 500px;
-            overflow-y: auto;
-        }
-        
-        .loading {
-            text-align: center;
-            color: #7f8c8d;
-            font-style: italic;
-        }
-        
-        .error {
-            background: #ffebee;
-            color: #c62828;
-            padding: 15px;
-            border-radius: 8px;
-            border-left: 4px solid #f44336;
-        }
-        
-        @keyframes pulse {
-            0% { opacity: 1; }
-            50% { opacity: 0.5; }
-            100% { opacity: 1; }
-        }
-        
-        .pulse {
-            animation: pulse 2s infinite;
-        }
-        
-        .quick-symbols {
-            display: flex;
-            gap: 10px;
-            flex-wrap: wrap;
-            justify-content: center;
-            margin-top: 15px;
-        }
-        
-        .symbol-btn {
-            background: white;
-            border: 2px solid #667eea;
-            color: #667eea;
-            padding: 8px 16px;
-            border-radius: 20px;
-            cursor: pointer;
-            transition: all 0.3s;
-            font-size: 14px;
-        }
-        
-        .symbol-btn:hover {
-            background: #667eea;
-            color: white;
-        }
-
-        /* Input container and autocomplete styles */
-        .input-container {
-            position: relative;
-            display: flex;
-            flex-direction: column;
-        }
-
-        .company-info {
-            font-size: 12px;
-            color: #666;
-            margin-top: 4px;
-            min-height: 16px;
-        }
-
-        .autocomplete-dropdown {
-            position: absolute;
-            top: 100%;
-            left: 0;
-            right: 0;
-            background: white;
-            border: 1px solid #ddd;
-            border-top: none;
-            border-radius: 0 0 8px 8px;
-            max-height: 200px;
-            overflow-y: auto;
-            z-index: 1000;
-            display: none;
-        }
-
-        .autocomplete-item {
-            padding: 12px;
-            cursor: pointer;
-            border-bottom: 1px solid #f0f0f0;
-        }
-
-        .autocomplete-item:hover {
-            background: #f8f9fa;
-        }
-
-        .autocomplete-item:last-child {
-            border-bottom: none;
-        }
-
-        .autocomplete-symbol {
-            font-weight: bold;
-            color: #667eea;
-        }
-
-        .autocomplete-company {
-            font-size: 12px;
-            color: #666;
-            margin-top: 2px;
-        }
-
-        /* History section styles */
-        .history-section {
-            background: white;
-            border-radius: 15px;
-            padding: 30px;
-            margin-top: 30px;
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.1);
-        }
-
-        .history-section h2 {
-            color: #2c3e50;
-            margin-bottom: 20px;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #e0e0e0;
-        }
-
-        .history-controls {
-            margin-bottom: 20px;
-        }
-
-        .history-container {
-            max-height: 400px;
-            overflow-y: auto;
-        }
-
-        .history-item {
-            background: #f8f9fa;
-            border-radius: 10px;
-            padding: 15px;
-            margin-bottom: 10px;
-            border-left: 4px solid #667eea;
-            cursor: pointer;
-            transition: all 0.3s;
-        }
-
-        .history-item:hover {
-            background: #e9ecef;
-            transform: translateY(-2px);
-            box-shadow: 0 3px 10px rgba(0, 0, 0, 0.1);
-        }
-
-        .history-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 8px;
-        }
-
-        .history-symbol {
-            font-weight: bold;
-            font-size: 1.1em;
-            color: #2c3e50;
-        }
-
-        .history-decision {
-            padding: 4px 12px;
-            border-radius: 20px;
-            font-size: 12px;
-            font-weight: bold;
-            text-transform: uppercase;
-        }
-
-        .history-decision.buy {
-            background: #d4edda;
-            color: #155724;
-        }
-
-        .history-decision.sell {
-            background: #f8d7da;
-            color: #721c24;
-        }
-
-        .history-decision.hold {
-            background: #fff3cd;
-            color: #856404;
-        }
-
-        .history-meta {
-            font-size: 12px;
-            color: #666;
-            display: flex;
-            gap: 15px;
-        }
-
-        .history-date {
-            display: flex;
-            align-items: center;
-            gap: 4px;
-        }
-
-        .history-duration {
-            color: #2ecc71;
-            font-weight: 500;
-            font-size: 0.9em;
-        }
-
-        .stock-metrics {
-            background: #ffffff;
-            border: 1px solid #e9ecef;
-            border-radius: 8px;
-            padding: 10px;
-            margin: 8px 0;
-            font-size: 0.85em;
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 6px;
-        }
-
-        .metric-item {
-            display: flex;
-            justify-content: space-between;
-            padding: 2px 0;
-        }
-
-        .metric-label {
-            color: #666;
-            font-weight: 500;
-        }
-
-        .metric-value {
-            color: #333;
-            font-weight: 600;
-        }
-
-        .metric-value.positive {
-            color: #28a745;
-        }
-
-        .metric-value.negative {
-            color: #dc3545;
-        }
-
-        .price-main {
-            font-size: 1.1em;
-            font-weight: bold;
-            color: #2c3e50;
-        }
-
-        .history-actions {
-            margin-top: 10px;
-            display: flex;
-            justify-content: flex-end;
-            gap: 8px;
-        }
-
-        .download-btn {
-            background: linear-gradient(45deg, #3498db, #2980b9);
-            color: white;
-            border: none;
-            padding: 6px 12px;
-            border-radius: 6px;
-            font-size: 0.85em;
-            cursor: pointer;
-            transition: all 0.3s;
-            min-width: 60px;
-        }
-
-        .download-btn:hover {
-            background: linear-gradient(45deg, #2980b9, #3498db);
-            transform: translateY(-1px);
-            box-shadow: 0 3px 8px rgba(52, 152, 219, 0.3);
-        }
-
-        .pdf-btn {
-            background: linear-gradient(45deg, #e74c3c, #c0392b);
-        }
-
-        .pdf-btn:hover {
-            background: linear-gradient(45deg, #c0392b, #e74c3c);
-            box-shadow: 0 3px 8px rgba(231, 76, 60, 0.3);
-        }
-
-        /* Mobile Responsiveness */
-        @media (max-width: 768px) {
-            body {
-                padding: 10px;
-            }
-            
-            .container {
-                padding: 15px;
-                border-radius: 15px;
-            }
-            
-            .header h1 {
-                font-size: 1.8em;
-                margin-bottom: 5px;
-            }
-            
-            .header p {
-                font-size: 1em;
-            }
-            
-            .analysis-form {
-                padding: 20px;
-                margin-bottom: 20px;
-            }
-            
-            .form-group {
-                flex-direction: column;
-                gap: 10px;
-                align-items: stretch;
-            }
-            
-            .form-group input {
-                min-width: auto;
-                width: 100%;
-            }
-            
-            .btn {
-                width: 100%;
-                padding: 15px;
-                font-size: 18px;
-            }
-            
-            .status-grid {
-                grid-template-columns: 1fr;
-                gap: 15px;
-            }
-            
-            .status-card {
-                padding: 15px;
-            }
-            
-            .status-card h3 {
-                font-size: 1em;
-            }
-            
-            .popular-stocks {
-                justify-content: center;
-            }
-            
-            .stock-btn {
-                padding: 8px 12px;
-                font-size: 14px;
-                min-width: 60px;
-            }
-            
-            .results-section {
-                padding: 15px;
-            }
-            
-            .results-section h2 {
-                font-size: 1.3em;
-            }
-            
-            .history-section {
-                padding: 15px;
-            }
-            
-            .history-section h2 {
-                font-size: 1.3em;
-            }
-            
-            .history-item {
-                padding: 12px;
-            }
-            
-            .history-header {
-                flex-direction: column;
-                align-items: flex-start;
-                gap: 5px;
-            }
-            
-            .history-symbol {
-                font-size: 1.1em;
-            }
-            
-            .history-decision {
-                font-size: 0.8em;
-                padding: 3px 8px;
-            }
-            
-            .autocomplete-dropdown {
-                max-height: 200px;
-            }
-            
-            .autocomplete-item {
-                padding: 12px;
-                font-size: 16px;
-            }
-
-            /* Mobile-specific improvements */
-            .header {
-                margin-bottom: 25px;
-                padding-bottom: 15px;
-            }
-            
-            .popular-stocks {
-                flex-wrap: wrap;
-                gap: 8px;
-            }
-            
-            /* Improve touch targets */
-            input, button, .stock-btn, .history-item {
-                min-height: 44px; /* iOS/Android recommended minimum */
-            }
-            
-            /* Prevent zoom on input focus */
-            input {
-                font-size: 16px;
-            }
-        }
-
-        @media (max-width: 480px) {
-            .header h1 {
-                font-size: 1.5em;
-            }
-            
-            .analysis-form {
-                padding: 15px;
-            }
-            
-            .stock-btn {
-                padding: 6px 10px;
-                font-size: 12px;
-                min-width: 50px;
-            }
-            
-            .status-card {
-                padding: 12px;
-            }
-            
-            .history-item {
-                padding: 10px;
-            }
-
-            .history-actions {
-                justify-content: center;
-                margin-top: 8px;
-            }
-
-            .download-btn {
-                font-size: 12px;
-                padding: 6px 10px;
-                min-width: 50px;
-            }
-
-            .history-actions {
-                gap: 6px;
-            }
-            
-            .stock-metrics {
-                grid-template-columns: 1fr;
-                font-size: 0.8em;
-                padding: 8px;
-            }
-            
-            .metric-item {
-                padding: 3px 0;
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🤖 TradingAgents Dashboard</h1>
-            <p>Multi-Agent LLM Financial Trading Analysis</p>
-        </div>
-
-        <div class="analysis-form">
-            <form onsubmit="startAnalysis(event)">
-                <div class="form-group">
-                    <div class="input-container">
-                        <input type="text" id="symbol" placeholder="Stock Symbol (e.g. AAPL, TSLA, NVDA)" required autocomplete="off">
-                        <div id="companyInfo" class="company-info"></div>
-                        <div id="autocomplete" class="autocomplete-dropdown"></div>
-                    </div>
-                    <input type="date" id="date" value="2025-08-27">
-                    <button type="submit" id="analyzeBtn" class="btn">🔍 Start Analysis</button>
-                </div>
-                <div class="quick-symbols">
-                    <span class="symbol-btn" onclick="setSymbol('AAPL')">AAPL</span>
-                    <span class="symbol-btn" onclick="setSymbol('TSLA')">TSLA</span>
-                    <span class="symbol-btn" onclick="setSymbol('NVDA')">NVDA</span>
-                    <span class="symbol-btn" onclick="setSymbol('MSFT')">MSFT</span>
-                    <span class="symbol-btn" onclick="setSymbol('GOOGL')">GOOGL</span>
-                    <span class="symbol-btn" onclick="setSymbol('AMZN')">AMZN</span>
-                </div>
-            </form>
-        </div>
-
-        <div class="status-section">
-            <div class="status-grid">
-                <div class="status-card">
-                    <h3>System Status</h3>
-                    <p id="systemStatus"><span class="status-indicator status-warning"></span>Checking...</p>
-                </div>
-                <div class="status-card">
-                    <h3>Analysis Progress</h3>
-                    <p id="analysisProgress">Ready to analyze</p>
-                </div>
-                <div class="status-card">
-                    <h3>Active Agents</h3>
-                    <p id="activeAgents">0 / 7 agents</p>
-                </div>
-                <div class="status-card">
-                    <h3>API Status</h3>
-                    <p id="apiStatus"><span class="status-indicator status-warning"></span>Connecting...</p>
-                </div>
-            </div>
-        </div>
-
-        <div class="progress-section" id="progressSection" style="display: none;">
-            <h3>Analysis Progress</h3>
-            <div class="progress-bar">
-                <div class="progress-fill" id="progressFill"></div>
-            </div>
-            <div class="agent-status" id="agentStatus">
-                <div class="agent-card">
-                    <h4>Fundamental</h4>
-                    <p>Ready</p>
-                </div>
-                <div class="agent-card">
-                    <h4>Sentiment</h4>
-                    <p>Ready</p>
-                </div>
-                <div class="agent-card">
-                    <h4>News</h4>
-                    <p>Ready</p>
-                </div>
-                <div class="agent-card">
-                    <h4>Technical</h4>
-                    <p>Ready</p>
-                </div>
-                <div class="agent-card">
-                    <h4>Bullish</h4>
-                    <p>Ready</p>
-                </div>
-                <div class="agent-card">
-                    <h4>Bearish</h4>
-                    <p>Ready</p>
-                </div>
-                <div class="agent-card">
-                    <h4>Trader</h4>
-                    <p>Ready</p>
-                </div>
-            </div>
-        </div>
-
-        <div class="results-section" id="resultsSection" style="display: none;">
-            <h2>📊 Analysis Results</h2>
-            <div id="results"></div>
-        </div>
-
-        <div class="history-section">
-            <h2>📈 Analysis History</h2>
-            <div class="history-controls">
-                <button onclick="loadAnalysisHistory()" class="btn">🔄 Refresh History</button>
-            </div>
-            <div id="historyContainer" class="history-container">
-                <div class="loading">Loading analysis history...</div>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        let currentAnalysisId = null;
-        let analysisInterval = null;
-
-        // Check system status on load
-        window.onload = function() {
-            checkSystemStatus();
-            setInterval(checkSystemStatus, 30000); // Check every 30 seconds
-            setupAutoComplete();
-            // Load analysis history on startup
-            loadAnalysisHistory();
-        };
-
-        function setSymbol(symbol) {
-            document.getElementById('symbol').value = symbol;
-            updateCompanyInfo(symbol);
-            hideAutocomplete();
-        }
-
-        // Auto-complete functionality
-        function setupAutoComplete() {
-            const symbolInput = document.getElementById('symbol');
-            const autocompleteDiv = document.getElementById('autocomplete');
-            let searchTimeout;
-
-            symbolInput.addEventListener('input', function() {
-                const query = this.value.trim().toUpperCase();
-                
-                // Clear previous timeout
-                if (searchTimeout) clearTimeout(searchTimeout);
-                
-                if (query.length === 0) {
-                    hideAutocomplete();
-                    document.getElementById('companyInfo').textContent = '';
-                    return;
-                }
-
-                // Update company info for exact matches
-                updateCompanyInfo(query);
-
-                // Debounce search
-                searchTimeout = setTimeout(() => {
-                    if (query.length >= 1) {
-                        searchCompanies(query);
-                    } else {
-                        hideAutocomplete();
-                    }
-                }, 300);
-            });
-
-            symbolInput.addEventListener('blur', function() {
-                // Hide autocomplete after a short delay to allow clicks
-                setTimeout(hideAutocomplete, 200);
-            });
-
-            symbolInput.addEventListener('focus', function() {
-                const query = this.value.trim().toUpperCase();
-                if (query.length >= 1) {
-                    searchCompanies(query);
-                }
-            });
-        }
-
-        async function updateCompanyInfo(symbol) {
-            if (symbol.length === 0) {
-                document.getElementById('companyInfo').textContent = '';
-                return;
-            }
-
-            try {
-                const response = await fetch(`/api/company-info/${symbol}`);
-                const data = await response.json();
-                
-                if (data.found) {
-                    document.getElementById('companyInfo').textContent = data.company_name;
-                } else {
-                    document.getElementById('companyInfo').textContent = '';
-                }
-            } catch (error) {
-                document.getElementById('companyInfo').textContent = '';
-            }
-        }
-
-        async function searchCompanies(query) {
-            try {
-                const response = await fetch(`/api/search-companies/${query}`);
-                const data = await response.json();
-                showAutocomplete(data.matches);
-            } catch (error) {
-                console.error('Search error:', error);
-                hideAutocomplete();
-            }
-        }
-
-        function showAutocomplete(matches) {
-            const autocompleteDiv = document.getElementById('autocomplete');
-            
-            if (matches.length === 0) {
-                hideAutocomplete();
-                return;
-            }
-
-            autocompleteDiv.innerHTML = '';
-            matches.forEach(match => {
-                const item = document.createElement('div');
-                item.className = 'autocomplete-item';
-                item.innerHTML = `
-                    <div class="autocomplete-symbol">${match.symbol}</div>
-                    <div class="autocomplete-company">${match.company_name}</div>
-                `;
-                item.onclick = () => selectSymbol(match.symbol);
-                autocompleteDiv.appendChild(item);
-            });
-
-            autocompleteDiv.style.display = 'block';
-        }
-
-        function hideAutocomplete() {
-            document.getElementById('autocomplete').style.display = 'none';
-        }
-
-        function selectSymbol(symbol) {
-            document.getElementById('symbol').value = symbol;
-            updateCompanyInfo(symbol);
-            hideAutocomplete();
-        }
-
-        // Analysis History functionality
-        async function loadAnalysisHistory() {
-            const historyContainer = document.getElementById('historyContainer');
-            historyContainer.innerHTML = '<div class="loading">Loading analysis history...</div>';
-
-            try {
-                const response = await fetch('/api/history');
-                const data = await response.json();
-                
-                if (data.analyses && data.analyses.length > 0) {
-                    displayAnalysisHistory(data.analyses);
-                } else {
-                    historyContainer.innerHTML = '<div class="loading">No analysis history found. Run some analyses to see them here!</div>';
-                }
-            } catch (error) {
-                console.error('History loading error:', error);
-                historyContainer.innerHTML = '<div class="error">Failed to load analysis history</div>';
-            }
-        }
-
-        function displayAnalysisHistory(analyses) {
-            const historyContainer = document.getElementById('historyContainer');
-            historyContainer.innerHTML = '';
-
-            analyses.forEach(analysis => {
-                const historyItem = document.createElement('div');
-                historyItem.className = 'history-item';
-                
-                const decision = analysis.decision || 'Unknown';
-                const decisionClass = decision.toLowerCase().includes('buy') ? 'buy' : 
-                                    decision.toLowerCase().includes('sell') ? 'sell' : 
-                                    decision.toLowerCase().includes('hold') ? 'hold' : '';
-                
-                const completedAt = analysis.completed_at ? new Date(analysis.completed_at) : null;
-                const timeStr = completedAt ? completedAt.toLocaleString() : 'Unknown time';
-                const duration = analysis.duration_formatted || 'Unknown duration';
-                
-                historyItem.innerHTML = `
-                    <div class="history-header">
-                        <div class="history-symbol">${analysis.symbol}</div>
-                        <div class="history-decision ${decisionClass}">${decision}</div>
-                    </div>
-                    <div class="history-meta">
-                        <div class="history-date">📅 ${timeStr}</div>
-                        <div>📊 Analysis Date: ${analysis.date}</div>
-                        <div class="history-duration">⏱️ Duration: ${duration}</div>
-                    </div>
-                    <div class="stock-metrics" id="stock-metrics-${analysis.analysis_id}">
-                        <div style="grid-column: 1 / -1; text-align: center; color: #666;">Loading stock data...</div>
-                    </div>
-                    <div class="history-actions">
-                        <button class="download-btn" onclick="downloadAnalysis('${analysis.analysis_id}', '${analysis.symbol}')">
-                            📄 Text
-                        </button>
-                        <button class="download-btn pdf-btn" onclick="downloadAnalysisPDF('${analysis.analysis_id}', '${analysis.symbol}')">
-                            📑 PDF
-                        </button>
-                    </div>
-                `;
-
-                historyItem.onclick = () => viewHistoryDetails(analysis);
-                historyContainer.appendChild(historyItem);
-                
-                // Fetch stock data for this symbol
-                fetchStockMetrics(analysis.symbol, analysis.analysis_id);
-            });
-        }
-        
-        async function fetchStockMetrics(symbol, analysisId) {
-            try {
-                const response = await fetch(`/api/stock-info/${symbol}`);
-                const stockData = await response.json();
-                
-                if (response.ok && !stockData.error) {
-                    displayStockMetrics(stockData, analysisId);
-                } else {
-                    displayStockError(symbol, analysisId);
-                }
-            } catch (error) {
-                console.error(`Error fetching stock data for ${symbol}:`, error);
-                displayStockError(symbol, analysisId);
-            }
-        }
-        
-        function displayStockMetrics(stock, analysisId) {
-            const metricsContainer = document.getElementById(`stock-metrics-${analysisId}`);
-            if (!metricsContainer) return;
-            
-            const changeClass = stock.day_change_pct >= 0 ? 'positive' : 'negative';
-            const changeIcon = stock.day_change_pct >= 0 ? '📈' : '📉';
-            
-            metricsContainer.innerHTML = `
-                <div class="metric-item" style="grid-column: 1 / -1;">
-                    <span class="metric-label">💰 Current Price:</span>
-                    <span class="metric-value price-main ${changeClass}">$${stock.current_price || 'N/A'} ${changeIcon} ${stock.day_change_pct || 0}%</span>
-                </div>
-                <div class="metric-item">
-                    <span class="metric-label">📊 P/E Ratio:</span>
-                    <span class="metric-value">${stock.pe_ratio || 'N/A'}</span>
-                </div>
-                <div class="metric-item">
-                    <span class="metric-label">🏢 Market Cap:</span>
-                    <span class="metric-value">${stock.market_cap || 'N/A'}</span>
-                </div>
-                <div class="metric-item">
-                    <span class="metric-label">📈 52W High:</span>
-                    <span class="metric-value">$${stock.fifty_two_week_high || 'N/A'}</span>
-                </div>
-                <div class="metric-item">
-                    <span class="metric-label">📉 52W Low:</span>
-                    <span class="metric-value">$${stock.fifty_two_week_low || 'N/A'}</span>
-                </div>
-                <div class="metric-item">
-                    <span class="metric-label">📊 Volume:</span>
-                    <span class="metric-value">${stock.volume || 'N/A'}</span>
-                </div>
-                ${stock.dividend_yield ? `<div class="metric-item">
-                    <span class="metric-label">💵 Dividend:</span>
-                    <span class="metric-value">${stock.dividend_yield}%</span>
-                </div>` : ''}
-            `;
-        }
-        
-        function displayStockError(symbol, analysisId) {
-            const metricsContainer = document.getElementById(`stock-metrics-${analysisId}`);
-            if (!metricsContainer) return;
-            
-            metricsContainer.innerHTML = `
-                <div style="grid-column: 1 / -1; text-align: center; color: #dc3545; font-size: 0.8em;">
-                    ⚠️ Stock data unavailable for ${symbol}
-                </div>
-            `;
-        }
-
-        function viewHistoryDetails(analysis) {
-            // Re-run analysis for this symbol and date
-            document.getElementById('symbol').value = analysis.symbol;
-            document.getElementById('date').value = analysis.date;
-            updateCompanyInfo(analysis.symbol);
-            
-            // Scroll to top
-            window.scrollTo({ top: 0, behavior: 'smooth' });
-            
-            // Optionally show a message
-            const analysisProgress = document.getElementById('analysisProgress');
-            if (analysisProgress) {
-                analysisProgress.textContent = `Click "Start Analysis" to re-run analysis for ${analysis.symbol}`;
-            }
-        }
-
-        async function checkSystemStatus() {
-            console.log('🔍 Checking system status...');
-            try {
-                const response = await fetch('/api/health');
-                console.log('📡 API Response:', response.status);
-                const data = await response.json();
-                console.log('📊 API Data:', data);
-                
-                if (data.status === 'healthy') {
-                    console.log('✅ System is healthy, updating UI');
-                    document.getElementById('systemStatus').innerHTML = 
-                        '<span class="status-indicator status-healthy"></span>System Healthy';
-                    document.getElementById('apiStatus').innerHTML = 
-                        '<span class="status-indicator status-healthy"></span>API Connected';
-                } else {
-                    console.log('❌ System not healthy:', data.status);
-                    document.getElementById('systemStatus').innerHTML = 
-                        '<span class="status-indicator status-error"></span>System Error';
-                    document.getElementById('apiStatus').innerHTML = 
-                        '<span class="status-indicator status-error"></span>API Error';
-                }
-            } catch (error) {
-                console.error('💥 API Error:', error);
-                document.getElementById('systemStatus').innerHTML = 
-                    '<span class="status-indicator status-error"></span>Connection Failed';
-                document.getElementById('apiStatus').innerHTML = 
-                    '<span class="status-indicator status-error"></span>API Offline';
-            }
-        }
-
-        let progressCheckInterval = null;
-
-        async function startAnalysis(event) {
-            event.preventDefault();
-            
-            const symbol = document.getElementById('symbol').value.toUpperCase();
-            const date = document.getElementById('date').value;
-            
-            if (!symbol) {
-                alert('Please enter a stock symbol');
-                return;
-            }
-
-            // Show progress section
-            document.getElementById('progressSection').style.display = 'block';
-            document.getElementById('resultsSection').style.display = 'none';
-            
-            // Update UI
-            const analyzeBtn = document.getElementById('analyzeBtn');
-            analyzeBtn.disabled = true;
-            analyzeBtn.textContent = '🔄 Analyzing...';
-            analyzeBtn.classList.add('pulse');
-            
-            document.getElementById('analysisProgress').textContent = `Analyzing ${symbol}...`;
-            document.getElementById('activeAgents').textContent = 'Initializing agents...';
-            
-            // Reset progress
-            document.getElementById('progressFill').style.width = '5%';
-            
-            try {
-                const response = await fetch('/api/analyze', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify({ symbol, date }),
-                });
-                
-                // Check if response is actually JSON
-                const contentType = response.headers.get('content-type');
-                if (!contentType || !contentType.includes('application/json')) {
-                    const responseText = await response.text();
-                    showError(`Server returned non-JSON response: ${responseText.substring(0, 200)}...`);
-                    return;
-                }
-                
-                const result = await response.json();
-                
-                if (result.error) {
-                    showError(result.message || 'Analysis failed');
-                } else if (result.status === 'started') {
-                    // Store analysis ID and start progress tracking for async analysis
-                    currentAnalysisId = result.analysis_id;
-                    console.log(`🚀 Analysis started with ID: ${currentAnalysisId}`);
-                    startRealTimeProgress();
-                } else {
-                    // Handle synchronous response - still start progress tracking to show intermediate steps
-                    currentAnalysisId = result.analysis_id;
-                    console.log(`📊 Analysis completed with ID: ${currentAnalysisId}`);
-                    
-                    // Start progress tracking briefly to show any intermediate states
-                    startRealTimeProgress();
-                    
-                    // Show results after a brief delay to allow progress to be seen
-                    setTimeout(() => {
-                        if (progressCheckInterval) {
-                            clearInterval(progressCheckInterval);
-                            progressCheckInterval = null;
-                        }
-                        showResults(result);
-                        
-                        // Reset button
-                        const analyzeBtn = document.getElementById('analyzeBtn');
-                        analyzeBtn.disabled = false;
-                        analyzeBtn.textContent = '🔍 Start Analysis';
-                        analyzeBtn.classList.remove('pulse');
-                    }, 3000); // Wait 3 seconds to show progress
-                }
-            } catch (error) {
-                console.error('Analysis error:', error);
-                if (error.message.includes('Unexpected token') || error.message.includes('JSON') || error.message.includes('Expecting value')) {
-                    showError('Server returned invalid response. The API service may be starting up or experiencing issues. Please wait a moment and try again.');
-                } else {
-                    showError('Network error: ' + error.message);
-                }
-                
-                // Reset button on error
-                const analyzeBtn = document.getElementById('analyzeBtn');
-                analyzeBtn.disabled = false;
-                analyzeBtn.textContent = '🔍 Start Analysis';
-                analyzeBtn.classList.remove('pulse');
-                
-                // Stop progress tracking on error
-                if (progressCheckInterval) {
-                    clearInterval(progressCheckInterval);
-                    progressCheckInterval = null;
-                }
-            }
-        }
-
-        function startRealTimeProgress() {
-            if (!currentAnalysisId) {
-                console.log('❌ No analysis ID available for progress tracking');
-                return;
-            }
-            
-            // Poll for real progress every 2 seconds
-            progressCheckInterval = setInterval(async () => {
-                try {
-                    console.log(`🔄 Checking progress for analysis: ${currentAnalysisId}`);
-                    const response = await fetch(`/api/progress/${currentAnalysisId}`);
-                    
-                    if (response.ok) {
-                        // Check if response is actually JSON
-                        const contentType = response.headers.get('content-type');
-                        if (!contentType || !contentType.includes('application/json')) {
-                            console.warn('⚠️ Progress endpoint returned non-JSON response');
-                            return;
-                        }
-                        
-                        const progressData = await response.json();
-                        console.log('📊 Progress data:', progressData);
-                        
-                        // Update progress bar
-                        const progress = progressData.progress || 0;
-                        document.getElementById('progressFill').style.width = progress + '%';
-                        
-                        // Update status messages
-                        const status = progressData.status || 'unknown';
-                        const currentAgent = progressData.current_agent || 'System';
-                        const messages = progressData.messages || [];
-                        
-                        document.getElementById('analysisProgress').textContent = 
-                            messages.length > 0 ? messages[messages.length - 1] : `Status: ${status}`;
-                        document.getElementById('activeAgents').textContent = `${currentAgent} (${progress}%)`;
-                        
-                        // Update individual agent cards based on progress
-                        updateAgentCards(progress, currentAgent);
-                        
-                        // Stop polling when complete
-                        if (status === 'completed' || progress >= 100) {
-                            console.log('✅ Analysis completed, stopping progress polling');
-                            clearInterval(progressCheckInterval);
-                            progressCheckInterval = null;
-                            
-                            // Update final status
-                            document.getElementById('analysisProgress').textContent = '✅ Analysis Complete';
-                            document.getElementById('activeAgents').textContent = 'All agents finished';
-                            document.getElementById('progressFill').style.width = '100%';
-                            
-                            // Reset all agent cards to Ready state
-                            const agentCards = document.querySelectorAll('.agent-card');
-                            agentCards.forEach(card => {
-                                card.classList.remove('active');
-                                card.querySelector('p').textContent = 'Ready';
-                            });
-                            
-                            // Show results from progress data
-                            if (progressData.result && progressData.decision) {
-                                const result = {
-                                    analysis_id: currentAnalysisId,
-                                    symbol: progressData.symbol,
-                                    analysis_date: progressData.date,
-                                    decision: progressData.decision,
-                                    result: progressData.result,
-                                    timestamp: progressData.completed_at,
-                                    status: 'completed'
-                                };
-                                showResults(result);
-                            }
-                            
-                            // Reset button
-                            const analyzeBtn = document.getElementById('analyzeBtn');
-                            analyzeBtn.disabled = false;
-                            analyzeBtn.textContent = '🔍 Start Analysis';
-                            analyzeBtn.classList.remove('pulse');
-                        }
-                    } else {
-                        console.log('⚠️ Progress endpoint not responding, using fallback');
-                        // Keep existing fake progress as fallback
-                        useFallbackProgress();
-                    }
-                } catch (error) {
-                    console.error('❌ Progress polling error:', error);
-                    // Keep existing fake progress as fallback
-                    useFallbackProgress();
-                }
-            }, 2000); // Update every 2 seconds
-        }
-        
-        function updateAgentCards(progress, currentAgent) {
-            // Reset all cards
-            const agentCards = document.querySelectorAll('.agent-card');
-            agentCards.forEach(card => {
-                card.classList.remove('active');
-                card.querySelector('p').textContent = 'Ready';
-            });
-            
-            // Highlight current active agent
-            const agentNames = {
-                'Fundamental': 'Fundamental',
-                'Sentiment': 'Sentiment', 
-                'News': 'News',
-                'Technical': 'Technical',
-                'Bullish': 'Bullish',
-                'Bearish': 'Bearish',
-                'Trading Decision Maker': 'Trader',
-                'Multi-Agent System': 'Fundamental' // Default to first agent
-            };
-            
-            const cardName = agentNames[currentAgent] || 'Fundamental';
-            const activeCard = Array.from(agentCards).find(card => 
-                card.querySelector('h4').textContent === cardName
-            );
-            
-            if (activeCard) {
-                activeCard.classList.add('active');
-                activeCard.querySelector('p').textContent = 'Working...';
-            }
-        }
-        
-        function useFallbackProgress() {
-            // Fallback fake progress if real progress fails
-            let progressStep = parseInt(document.getElementById('progressFill').style.width) || 10;
-            const maxProgress = 95;
-            
-            if (progressStep < maxProgress) {
-                progressStep += Math.random() * 3; // Slower increment
-                if (progressStep > maxProgress) progressStep = maxProgress;
-                
-                document.getElementById('progressFill').style.width = progressStep + '%';
-                
-                // Generic status messages
-                if (progressStep < 30) {
-                    document.getElementById('analysisProgress').textContent = '🚀 Analysis in progress...';
-                } else if (progressStep < 60) {
-                    document.getElementById('analysisProgress').textContent = '📊 Agents analyzing data...';
-                } else if (progressStep < 85) {
-                    document.getElementById('analysisProgress').textContent = '🤔 Final decision making...';
-                }
-            }
-        }
-
-
-        function showResults(result) {
-            document.getElementById('resultsSection').style.display = 'block';
-            
-            // Reset all agent cards to Ready state when showing results
-            const agentCards = document.querySelectorAll('.agent-card');
-            agentCards.forEach(card => {
-                card.classList.remove('active');
-                card.querySelector('p').textContent = 'Ready';
-            });
-            
-            let decisionClass = 'decision-card';
-            if (result.decision && result.decision.toLowerCase().includes('sell')) {
-                decisionClass += ' sell';
-            } else if (result.decision && result.decision.toLowerCase().includes('hold')) {
-                decisionClass += ' hold';
-            }
-            
-            const resultsHtml = `
-                <div class="${decisionClass}">
-                    <h3>🎯 Trading Decision</h3>
-                    <div style="font-size: 1.5em; margin-top: 10px;">
-                        ${result.decision || 'Analysis Complete'}
-                    </div>
-                </div>
-                
-                <div style="margin-bottom: 20px;">
-                    <strong>Symbol:</strong> ${result.symbol}<br>
-                    <strong>Analysis Date:</strong> ${result.analysis_date}<br>
-                    <strong>Completed:</strong> ${new Date(result.timestamp).toLocaleString()}<br>
-                    <strong>Status:</strong> ${result.status}
-                </div>
-                
-                <h3>📋 Detailed Analysis</h3>
-                <div class="analysis-details">${result.result || 'No detailed results available'}</div>
-            `;
-            
-            document.getElementById('results').innerHTML = resultsHtml;
-            document.getElementById('analysisProgress').textContent = 'Analysis Complete';
-        }
-
-        function showError(message) {
-            document.getElementById('resultsSection').style.display = 'block';
-            
-            // Reset all agent cards to Ready state on error
-            const agentCards = document.querySelectorAll('.agent-card');
-            agentCards.forEach(card => {
-                card.classList.remove('active');
-                card.querySelector('p').textContent = 'Ready';
-            });
-            
-            document.getElementById('results').innerHTML = `
-                <div class="error">
-                    <h3>❌ Analysis Error</h3>
-                    <p>${message}</p>
-                </div>
-            `;
-            document.getElementById('analysisProgress').textContent = 'Analysis Failed';
-            document.getElementById('activeAgents').textContent = '0 / 7 agents';
-        }
-
-        // Download analysis summary (text)
-        function downloadAnalysis(analysisId, symbol) {
-            event.stopPropagation(); // Prevent triggering the history item click
-            
-            // Create download link
-            const downloadUrl = `/api/download/${analysisId}`;
-            const link = document.createElement('a');
-            link.href = downloadUrl;
-            link.download = `analysis_${symbol}_${analysisId}.txt`;
-            document.body.appendChild(link);
-            link.click();
-            document.body.removeChild(link);
-        }
-
-        // Download analysis summary (PDF)
-        function downloadAnalysisPDF(analysisId, symbol) {
-            event.stopPropagation(); // Prevent triggering the history item click
-            
-            // Create download link
-            const downloadUrl = `/api/download/${analysisId}/pdf`;
-            const link = document.createElement('a');
-            link.href = downloadUrl;
-            link.download = `analysis_${symbol}_${analysisId}.pdf`;
-            document.body.appendChild(link);
-            link.click();
-            document.body.removeChild(link);
-        }
-    </script>
-</body>
-</html>
-"""
+def jsonify_fast(obj, status=200):
+    """Serialize a JSON response with orjson (emits bytes directly, no str->bytes encode)"""
+    return Response(
+        orjson.dumps(obj, option=ORJSON_OPTIONS),
+        status=status,
+        mimetype='application/json'
+    )
+
+# The analysis ID is built from symbol and date and ends up in upstream URL paths
+# (/progress/<id>), so both are restricted to these shapes before anything is scheduled
+SYMBOL_PATTERN = re.compile(r'[A-Z0-9.^=\-]{1,15}')
+DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# Progress states after which an analysis no longer changes
+PROGRESS_FINAL_STATES = ('completed', 'failed', 'timeout')
+
+# Callers of upstream through CLIENT: every concurrent request (see gunicorn_dashboard.conf.py;
+# GUNICORN_THREADS, or GUNICORN_WORKER_CONNECTIONS greenlets under the gevent worker) plus
+# the short-fetch and analysis pools below
+UPSTREAM_POOL_SIZE = 8
+ANALYSIS_POOL_SIZE = 8
+if os.getenv("GUNICORN_WORKER_CLASS", "gthread") == "gevent":
+    REQUEST_CONCURRENCY = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", 1000))
+else:
+    REQUEST_CONCURRENCY = int(os.getenv("GUNICORN_THREADS", 64))
+UPSTREAM_CALLERS = REQUEST_CONCURRENCY + UPSTREAM_POOL_SIZE + ANALYSIS_POOL_SIZE
+
+# Client shared by all upstream calls; HTTP/2 multiplexes concurrent requests (the
+# bootstrap fan-out, progress polls) over one connection, and the HTTP/1.1 fallback pool
+# has room for every caller at once so none waits on a connection slot
+CLIENT = httpx.Client(
+    base_url=TRADINGAGENTS_API_URL,
+    timeout=httpx.Timeout(10.0),
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=2,  # connection failures only
+        # Idle connections outlive the page's 30s status poll instead of httpx's 5s default,
+        # so quiet periods don't cost a new TCP+TLS handshake
+        limits=httpx.Limits(max_connections=UPSTREAM_CALLERS, max_keepalive_connections=32, keepalive_expiry=60)
+    )
+)
+
+# Short upstream GETs (singleflight fetches, the bootstrap fan-out) run on one shared pool;
+# concurrent identical calls share a single in-flight request. Analyses get their own pool
+# below so 10-minute runs can never starve these. Both are counted in CLIENT's connection limit
+_pool = ThreadPoolExecutor(max_workers=UPSTREAM_POOL_SIZE, thread_name_prefix='upstream')
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+def _fetch_upstream(path, timeout=10):
+    """GET an upstream API path and return (body bytes, status code)"""
+    response = CLIENT.get(path, timeout=timeout)
+    return response.content, response.status_code
+
+# Upstream headers relayed on streamed downloads; hop-by-hop ones like
+# Transfer-Encoding must not be forwarded through WSGI
+STREAMED_HEADERS = ('Content-Type', 'Content-Length', 'Content-Disposition')
+
+def stream_upstream(response):
+    """Relay a streamed upstream response (CLIENT.send(..., stream=True)) in 64 KB chunks instead of buffering the body"""
+    headers = {name: response.headers[name] for name in STREAMED_HEADERS if name in response.headers}
+    if 'Content-Encoding' in response.headers:
+        # iter_bytes() yields decoded bytes, so the upstream length no longer applies
+        headers.pop('Content-Length', None)
+
+    relayed = Response(
+        response.iter_bytes(chunk_size=64 * 1024),
+        status=response.status_code,
+        headers=headers
+    )
+    relayed.call_on_close(response.close)
+    return relayed
+
+def progress_version(data):
+    """Synthetic version for a progress payload; changes whenever the visible state does"""
+    state = f"{data.get('progress')}|{data.get('status')}|{data.get('current_agent')}|{len(data.get('messages') or [])}"
+    return hashlib.md5(state.encode('utf-8')).hexdigest()[:12]
+
+def progress_delta(data, since_msg):
+    """Progress payload carrying only messages from index since_msg on, with their offset
+
+    Final payloads always carry the whole list from offset 0: they may replace the list
+    rather than extend it (e.g. the failure payload built by analysis_failure()), which a
+    count alone can't detect. The same goes for a since_msg past the end.
+    """
+    messages = data.get('messages') or []
+    final = data.get('status') in PROGRESS_FINAL_STATES
+    offset = since_msg if not final and 0 <= since_msg <= len(messages) else 0
+    return {**data, 'messages': messages[offset:], 'message_offset': offset}
+
+# Seconds a request waits on a pooled upstream fetch; past that it answers 504 with
+# UPSTREAM_BUSY_MESSAGE (a future's TimeoutError has no message of its own)
+UPSTREAM_WAIT_TIMEOUT = 15
+UPSTREAM_BUSY_MESSAGE = f"The upstream API did not answer within {UPSTREAM_WAIT_TIMEOUT}s. Try again shortly."
+
+def singleflight_future(key, fn, *args, **kwargs):
+    """Submit fn to the pool unless a call under the same key is already in flight; returns its future"""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        if future is None:
+            future = _pool.submit(fn, *args, **kwargs)
+            _inflight[key] = future
+            future.add_done_callback(lambda _: _inflight.pop(key, None))
+    return future
+
+def singleflight(key, fn, *args, **kwargs):
+    """Run fn once per key; callers arriving while it is in flight wait for the same result"""
+    return singleflight_future(key, fn, *args, **kwargs).result(timeout=UPSTREAM_WAIT_TIMEOUT)
+
+def minify_lines(text):
+    """Strip indentation and blank lines
+
+    Line breaks are kept so JS without semicolons stays valid.
+    """
+    lines = (line.strip() for line in text.splitlines())
+    return '\n'.join(line for line in lines if line)
+
+def minify_js(js):
+    """Minify with rjsmin (template literals are kept verbatim)"""
+    return rjsmin.jsmin(js)
+
+def minify_html(html):
+    """Minify inline CSS with rcssmin, strip HTML comments, then minify line by line"""
+    html = re.sub(r'<style>(.*?)</style>', lambda m: f"<style>{rcssmin.cssmin(m.group(1))}</style>", html, flags=re.S)
+    html = re.sub(r'<!--.*?-->', '', html, flags=re.S)
+    return minify_lines(html)
+
+def precompress(body):
+    """ETag and precompressed variants (in order of preference) for a static body"""
+    return hashlib.md5(body).hexdigest(), {
+        'br': brotli.compress(body, quality=11),
+        'gzip': gzip.compress(body, compresslevel=9),
+    }
+
+def precompressed_response(body, etag, encoded, mimetype):
+    """Response for a static body in the best precompressed encoding the client accepts"""
+    encoding = next((enc for enc in encoded if request.accept_encodings[enc]), None)
+    if encoding:
+        response = Response(encoded[encoding], mimetype=mimetype)
+        response.headers['Content-Encoding'] = encoding
+        response.set_etag(f"{etag}-{encoding}")
+    else:
+        response = Response(body, mimetype=mimetype)
+        response.set_etag(etag)
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.cache_control.public = True
+    return response
+
+# Page script and stylesheet; minified and precompressed once at import and served
+# under content-hashed URLs, so browsers can cache them for good
+ASSET_MINIFIERS = {
+    'dashboard.js': minify_js,
+    'dashboard-deferred.css': rcssmin.cssmin,
+}
+ASSET_MIMETYPES = {'.js': 'text/javascript', '.css': 'text/css'}
+
+_ASSETS = {}
+for _name, _minify in ASSET_MINIFIERS.items():
+    _body = _minify(Path(app.static_folder, _name).read_text(encoding='utf-8')).encode('utf-8')
+    _ASSETS[_name] = (_body, *precompress(_body))
+
+def asset_version(name):
+    """Content hash used in a page asset's URL"""
+    return _ASSETS[name][1][:12]
+
+def asset_url(name):
+    """Content-hashed URL of a page asset"""
+    return f"/assets/{asset_version(name)}/{name}"
+
+# Dashboard page; static, so it is loaded, minified and compressed once at import.
+# The file references assets by their /static/ path, rewritten here to hashed URLs
+HTML_TEMPLATE = Path(app.static_folder, 'dashboard.html').read_text(encoding='utf-8')
+for _name in _ASSETS:
+    HTML_TEMPLATE = HTML_TEMPLATE.replace(f'"/static/{_name}"', f'"{asset_url(_name)}"')
+
+_HTML_MIN = minify_html(HTML_TEMPLATE).encode('utf-8')
+_HTML_ETAG, _HTML_ENCODED = precompress(_HTML_MIN)
 
 @app.route('/')
 def dashboard():
     """Main dashboard page"""
-    current_date = datetime.now().strftime('%Y-%m-%d')
-    return render_template_string(HTML_TEMPLATE, current_date=current_date)
+    response = precompressed_response(_HTML_MIN, _HTML_ETAG, _HTML_ENCODED, 'text/html')
+    response.cache_control.max_age = 3600
+    return response.make_conditional(request)
+
+@app.route('/assets/<version>/<name>')
+def asset(version, name):
+    """Page script/stylesheet under its content-hashed URL; cached as immutable"""
+    if name not in _ASSETS:
+        abort(404)
+    if version != asset_version(name):
+        # Stale or malformed hash (e.g. a page from another build): point at the current
+        # URL instead of pinning the current bytes to this one for a year
+        return redirect(asset_url(name))
+    body, etag, encoded = _ASSETS[name]
+    response = precompressed_response(body, etag, encoded, ASSET_MIMETYPES[Path(name).suffix])
+    response.cache_control.max_age = 31536000
+    response.cache_control.immutable = True
+    return response.make_conditional(request)
 
 @app.route('/api/health')
 def health_proxy():
     """Proxy health check to TradingAgents API"""
     try:
-        response = requests.get(f"{TRADINGAGENTS_API_URL}/api/health", timeout=10)
-        return response.json(), response.status_code
+        return cached_proxy("health", "/api/health")
     except Exception as e:
-        return {"status": "error", "message": str(e)}, 500
+        return jsonify_fast({"status": "error", "message": str(e)}, 500)
+
+# Analyses run upstream on a background pool so /api/analyze doesn't hold a
+# request thread for the whole run; futures are kept for an hour to report failures
+_analysis_pool = ThreadPoolExecutor(max_workers=ANALYSIS_POOL_SIZE, thread_name_prefix='analysis')
+_analyses = TTLCache(maxsize=256, ttl=3600)
+_analyses_lock = threading.Lock()
+
+# Repeat requests for the same (symbol, date) join the analysis already running, or one
+# that succeeded within the last minute, instead of starting another upstream run
+_running_analyses = {}
+_recent_analyses = TTLCache(maxsize=256, ttl=60)
+
+# Circuit breaker for upstream analyses: after ANALYZE_BREAKER_THRESHOLD consecutive runs
+# fail on the upstream side (timeouts, connection errors, gateway errors), new analyses are refused
+# for ANALYZE_BREAKER_COOLDOWN seconds instead of piling onto the analysis pool. After the
+# cooldown a single trial run is let through (half-open) and decides whether it closes again
+ANALYZE_BREAKER_THRESHOLD = 3
+ANALYZE_BREAKER_COOLDOWN = 60
+_breaker = {"failures": 0, "opened_at": None, "trial_in_flight": False}
+_breaker_lock = threading.Lock()
+
+def breaker_admit():
+    """Admit a new analysis run; returns 0 if admitted, else seconds to wait before retrying"""
+    with _breaker_lock:
+        opened_at = _breaker["opened_at"]
+        if opened_at is None:
+            return 0
+        if _breaker["trial_in_flight"]:
+            return ANALYZE_BREAKER_COOLDOWN
+        remaining = opened_at + ANALYZE_BREAKER_COOLDOWN - time.monotonic()
+        if remaining > 0:
+            return int(remaining) + 1
+        # Cooldown over: this run is the trial, everyone else waits for its outcome
+        _breaker["trial_in_flight"] = True
+        return 0
+
+def record_analysis_outcome(upstream_failed):
+    """Count a finished run; any run the upstream handled closes the breaker again"""
+    with _breaker_lock:
+        _breaker["trial_in_flight"] = False
+        if not upstream_failed:
+            _breaker["failures"] = 0
+            _breaker["opened_at"] = None
+            return
+        _breaker["failures"] += 1
+        if _breaker["failures"] >= ANALYZE_BREAKER_THRESHOLD:
+            # (Re)opened on every failure past the threshold, so a failed trial run after
+            # the cooldown shuts it again right away
+            _breaker["opened_at"] = time.monotonic()
+
+# Statuses meaning the upstream itself failed rather than the analysis: 408 is app.py
+# giving up on a stuck run after 8 minutes, 502-504 are the service or its proxy being down.
+# A 500 from app.py carries the analysis' own error (e.g. a ticker yfinance can't resolve)
+# and only counts when it has no JSON error body
+UPSTREAM_FAILURE_STATUSES = (408, 502, 503, 504)
+
+def upstream_failed(future):
+    """Whether a finished analysis run failed on the upstream side (feeds the breaker)"""
+    try:
+        body, status = future.result()
+    except httpx.TransportError:  # includes timeouts
+        return True
+    except Exception:
+        return False
+    if status in UPSTREAM_FAILURE_STATUSES:
+        return True
+    if status >= 500:
+        try:
+            return 'error' not in orjson.loads(body)
+        except (orjson.JSONDecodeError, TypeError):
+            return True
+    return False
+
+def _run_analysis(data):
+    """POST an analysis upstream and wait for it to finish; runs on the analysis pool
+
+    Returns (error body, status). The page picks up a successful result from the
+    progress endpoint, so a 200 body is discarded without being read.
+    """
+    with CLIENT.stream(
+        "POST",
+        "/api/analyze",
+        json=data,
+        timeout=600  # 10 minutes timeout
+    ) as response:
+        if response.status_code == 200:
+            return None, 200
+        return response.read(), response.status_code
+
+def _analysis_done(key, analysis_id, future):
+    """Done-callback: stop sharing the run (keeping it briefly reusable if it succeeded) and feed the breaker"""
+    error = future.exception()
+    status = future.result()[1] if error is None else None
+    succeeded = status == 200
+    record_analysis_outcome(upstream_failed(future))
+    with _analyses_lock:
+        if _running_analyses.get(key) == analysis_id:
+            del _running_analyses[key]
+        if succeeded:
+            _recent_analyses[key] = analysis_id
+
+def analysis_started_here(analysis_id):
+    """Whether this process started the analysis (within the last hour)"""
+    with _analyses_lock:
+        return analysis_id in _analyses
+
+def analysis_failure(analysis_id, progress_missing=False):
+    """Progress payload for a background analysis that ended in an error, else None
+
+    With progress_missing (upstream 404s the ID), a run that succeeded is reported as
+    well: an upstream that ignores the dashboard-assigned ID stores its progress under
+    an ID of its own, so this one would never reach a final state.
+    """
+    with _analyses_lock:
+        future = _analyses.get(analysis_id)
+    if future is None or not future.done():
+        return None
+
+    try:
+        body, status = future.result()
+        if status == 200:
+            if not progress_missing:
+                return None
+            message = ("The analysis finished, but the API has no progress under this ID. "
+                       "Its result is listed in the analysis history.")
+        else:
+            try:
+                error = orjson.loads(body)
+            except orjson.JSONDecodeError:
+                error = {}
+            message = error.get('message') or error.get('error') or f'Analysis failed (HTTP {status})'
+    except httpx.TimeoutException:
+        message = "Analysis took longer than 10 minutes. The system may still be processing."
+    except Exception as e:
+        message = str(e)
+
+    return {
+        "analysis_id": analysis_id,
+        "status": "failed",
+        "progress": 0,
+        "current_agent": "System",
+        "messages": [f"❌ {message}"]
+    }
+
+def fetch_progress(analysis_id):
+    """Upstream progress as (data, status), overridden when the background run has failed"""
+    try:
+        body, status = _fetch_upstream(f"/api/progress/{analysis_id}")
+        data = orjson.loads(body)
+    except Exception:
+        data, status = None, None
+    if status == 200 and data.get('status') in PROGRESS_FINAL_STATES:
+        return data, status
+
+    # Some upstream failures never update (or never create) the progress entry
+    failure = analysis_failure(analysis_id, progress_missing=status == 404)
+    if failure is not None:
+        return failure, 200
+    if data is None:
+        raise ConnectionError(f"Progress for {analysis_id} is unavailable")
+    return data, status
+
+# Idempotent upstream GETs are cached per endpoint; TTLs in seconds
+CACHE_TTLS = {
+    "health": 10,
+    "config": 300,
+    "agents": 300,
+    "company-info": 3600,
+    "search-companies": 600,
+    "history": 5,
+}
+_caches = {name: TTLCache(maxsize=512, ttl=ttl) for name, ttl in CACHE_TTLS.items()}
+_cache_lock = threading.Lock()
+
+def _fetch_cached(name, path):
+    """GET an upstream path and cache a 200 reply; returns ((body, etag), status), etag None if not cached"""
+    body, status = _fetch_upstream(path)
+    if status != 200:
+        return (body, None), status
+    entry = (body, hashlib.md5(body).hexdigest())
+    with _cache_lock:
+        _caches[name][path] = entry
+    return entry, status
+
+def cached_fetch_future(name, path):
+    """Future for an upstream GET through the endpoint's TTL cache (already resolved on a hit)"""
+    with _cache_lock:
+        entry = _caches[name].get(path)
+    if entry is None:
+        return singleflight_future(path, _fetch_cached, name, path)
+    future = Future()
+    future.set_result((entry, 200))
+    return future
+
+def cached_proxy(name, path):
+    """Serve an upstream GET from the TTL cache as raw JSON bytes, answering 304 when the ETag matches"""
+    try:
+        (body, etag), status = cached_fetch_future(name, path).result(timeout=UPSTREAM_WAIT_TIMEOUT)
+    except FutureTimeoutError:
+        return jsonify_fast({"error": "Upstream timeout", "message": UPSTREAM_BUSY_MESSAGE}, 504)
+    if status != 200:
+        return Response(body, status=status, mimetype='application/json')
+
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.max_age = CACHE_TTLS[name]
+    return response.make_conditional(request)
+
+# Upstream endpoints the page needs on first load, fetched together by /api/bootstrap
+BOOTSTRAP_ENDPOINTS = {
+    "health": "/api/health",
+    "config": "/api/config",
+    "agents": "/agents",  # served outside /api upstream
+    "history": "/api/history",
+}
+
+@app.route('/api/bootstrap')
+def bootstrap_proxy():
+    """Fetch health, config, agents and history concurrently (or from cache) in a single round-trip"""
+    futures = {key: cached_fetch_future(key, path) for key, path in BOOTSTRAP_ENDPOINTS.items()}
+    payload = {}
+    for key, future in futures.items():
+        try:
+            (body, _), _ = future.result(timeout=UPSTREAM_WAIT_TIMEOUT)
+            payload[key] = orjson.loads(body)
+        except FutureTimeoutError:
+            payload[key] = {"error": f"{key.capitalize()} failed", "message": UPSTREAM_BUSY_MESSAGE}
+        except Exception as e:
+            payload[key] = {"error": f"{key.capitalize()} failed", "message": str(e)}
+    return jsonify_fast(payload)
 
 @app.route('/api/analyze', methods=['POST'])
 def analyze_proxy():
-    """Proxy analysis request to TradingAgents API"""
+    """Start an analysis upstream in the background and return its ID immediately"""
     try:
-        data = request.get_json()
-        
-        # Forward request to TradingAgents API
-        response = requests.post(
-            f"{TRADINGAGENTS_API_URL}/api/analyze",
-            json=data,
-            timeout=600  # 10 minutes timeout
-        )
+        data = request.get_json() or {}
+        symbol = str(data.get('symbol', '')).strip().upper()
+        date = str(data.get('date', '')).strip()
+        if not SYMBOL_PATTERN.fullmatch(symbol) or not DATE_PATTERN.fullmatch(date):
+            return jsonify_fast({
+                "error": "Invalid request",
+                "message": "Expected a ticker symbol (letters, digits, '.', '-', '^' or '=') and a YYYY-MM-DD date."
+            }, 400)
+        key = (symbol, date)
+        
+        future = None
+        with _analyses_lock:
+            analysis_id = _running_analyses.get(key) or _recent_analyses.get(key)
+            retry_after = breaker_admit() if analysis_id is None else 0
+            if analysis_id is None and not retry_after:
+                # The ID is chosen here and passed upstream so progress can be tracked right away
+                analysis_id = f"{symbol}_{date}_{uuid.uuid4().hex[:8]}"
+                future = _analysis_pool.submit(
+                    _run_analysis, {**data, "symbol": symbol, "date": date, "analysis_id": analysis_id})
+                _analyses[analysis_id] = future
+                _running_analyses[key] = analysis_id
+        if retry_after:
+            response = jsonify_fast({
+                "error": "Upstream unavailable",
+                "message": f"The analysis service is failing; new analyses are paused. Try again in {retry_after}s."
+            }, 503)
+            response.headers['Retry-After'] = str(retry_after)
+            return response
+        # Registered outside the lock: the callback takes it and runs inline if the future is already done
+        if future is not None:
+            future.add_done_callback(lambda f: _analysis_done(key, analysis_id, f))
+        
+        return jsonify_fast({
+            "status": "started",
+            "analysis_id": analysis_id,
+            "symbol": symbol,
+            "date": date
+        }, 202)
         
-        return response.json(), response.status_code
-        
-    except requests.exceptions.Timeout:
-        return {
-            "error": "Analysis timeout", 
-            "message": "Analysis took longer than 10 minutes. The system may still be processing."
-        }, 408
     except Exception as e:
-        return {"error": "Analysis failed", "message": str(e)}, 500
+        return jsonify_fast({"error": "Analysis failed", "message": str(e)}, 500)
 
 @app.route('/api/progress/<analysis_id>')
 def progress_proxy(analysis_id):
-    """Proxy progress request to TradingAgents API"""
-    try:
-        response = requests.get(f"{TRADINGAGENTS_API_URL}/api/progress/{analysis_id}", timeout=10)
-        return response.json(), response.status_code
-    except Exception as e:
-        return {"error": "Progress check failed", "message": str(e)}, 500
-
-@app.route('/api/progress')
-def all_progress_proxy():
-    """Proxy all progress request to TradingAgents API"""
+    """Proxy progress request to TradingAgents API
+
+    With ?wait=<seconds>&since=<version> the request is held (up to 25s) until the
+    progress version differs from `since`, and answers 204 if nothing changed.
+    With ?since_msg=<count> only messages the client doesn't have yet are returned.
+    """
+    wait = min(max(request.args.get('wait', 0, type=int), 0), 25)
+    since = request.args.get('since', '')
+    since_msg = request.args.get('since_msg', 0, type=int)
+    deadline = time.monotonic() + wait
     try:
-        response = requests.get(f"{TRADINGAGENTS_API_URL}/api/progress", timeout=10)
-        return response.json(), response.status_code
+        while True:
+            data, status = fetch_progress(analysis_id)
+            if status != 200:
+                return jsonify_fast(data, status)
+
+            data['version'] = progress_version(data)
+            if data['version'] != since or data.get('status') in PROGRESS_FINAL_STATES:
+                return jsonify_fast(progress_delta(data, since_msg))
+            if time.monotonic() >= deadline:
+                return '', 204
+            time.sleep(1)
     except Exception as e:
-        return {"error": "Progress check failed", "message": str(e)}, 500
+        return jsonify_fast({"error": "Progress check failed", "message": str(e)}, 500)
+
+# Seconds a progress stream waits for an ID that upstream doesn't know and this process
+# didn't start before giving up on it, so made-up IDs don't hold a request thread for 10 minutes
+UNKNOWN_ANALYSIS_GRACE = 10
+
+@app.route('/api/progress/<analysis_id>/stream')
+def progress_stream(analysis_id):
+    """Stream analysis progress as Server-Sent Events, sending a frame only when it changes
+
+    Each frame carries only the messages added since the previous frame.
+    """
+    def generate():
+        last_version = None
+        sent_messages = 0
+        started = time.monotonic()
+        deadline = started + 600
+        while time.monotonic() < deadline:
+            try:
+                data, status = fetch_progress(analysis_id)
+            except Exception:
+                data, status = None, None
+
+            if status == 200:
+                # Same change detection as the long-poll; the payload (which carries the
+                # full analysis text once complete) is only serialized when it is sent
+                version = progress_version(data)
+                if version != last_version:
+                    last_version = version
+                    delta = progress_delta(data, sent_messages)
+                    sent_messages = delta['message_offset'] + len(delta['messages'])
+                    yield b"data: " + orjson.dumps(delta) + b"\n\n"
+                if data.get('status') in PROGRESS_FINAL_STATES:
+                    break
+            elif (status == 404 and time.monotonic() - started > UNKNOWN_ANALYSIS_GRACE
+                    and not analysis_started_here(analysis_id)):
+                unknown = {
+                    "analysis_id": analysis_id,
+                    "status": "failed",
+                    "progress": 0,
+                    "current_agent": "System",
+                    "messages": ["❌ Unknown analysis. It may have expired or never been started."]
+                }
+                yield b"data: " + orjson.dumps(progress_delta(unknown, sent_messages)) + b"\n\n"
+                break
+            else:
+                # Comment frame keeps the connection alive until the analysis shows up upstream
+                yield ": waiting\n\n"
+            time.sleep(1)
+
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
 @app.route('/api/config')
 def config_proxy():
     """Proxy config request to TradingAgents API"""
     try:
-        response = requests.get(f"{TRADINGAGENTS_API_URL}/api/config", timeout=10)
-        return response.json(), response.status_code
+        return cached_proxy("config", "/api/config")
     except Exception as e:
-        return {"error": "Config failed", "message": str(e)}, 500
+        return jsonify_fast({"error": "Config failed", "message": str(e)}, 500)
 
 @app.route('/api/agents')
 def agents_proxy():
     """Proxy agents request to TradingAgents API"""
     try:
-        response = requests.get(f"{TRADINGAGENTS_API_URL}/api/agents", timeout=10)
-        return response.json(), response.status_code
+        return cached_proxy("agents", "/agents")
     except Exception as e:
-        return {"error": "Agents failed", "message": str(e)}, 500
+        return jsonify_fast({"error": "Agents failed", "message": str(e)}, 500)
 
 @app.route('/api/history')
 def history_proxy():
     """Proxy history request to TradingAgents API"""
     try:
-        response = requests.get(f"{TRADINGAGENTS_API_URL}/api/history", timeout=10)
-        return response.json(), response.status_code
+        return cached_proxy("history", "/api/history")
     except Exception as e:
-        return {"error": "History failed", "message": str(e)}, 500
+        return jsonify_fast({"error": "History failed", "message": str(e)}, 500)
 
 @app.route('/api/company-info/<symbol>')
 def company_info_proxy(symbol):
     """Proxy company info request to TradingAgents API"""
     try:
-        response = requests.get(f"{TRADINGAGENTS_API_URL}/api/company-info/{symbol}", timeout=10)
-        return response.json(), response.status_code
+        return cached_proxy("company-info", f"/api/company-info/{symbol}")
     except Exception as e:
-        return {"error": "Company info failed", "message": str(e)}, 500
+        return jsonify_fast({"error": "Company info failed", "message": str(e)}, 500)
 
 @app.route('/api/search-companies/<query>')
 def search_companies_proxy(query):
     """Proxy company search request to TradingAgents API"""
     try:
-        response = requests.get(f"{TRADINGAGENTS_API_URL}/api/search-companies/{query}", timeout=10)
-        return response.json(), response.status_code
+        return cached_proxy("search-companies", f"/api/search-companies/{query}")
     except Exception as e:
-        return {"error": "Company search failed", "message": str(e)}, 500
-
-@app.route('/api/download/<analysis_id>')
-def download_analysis_proxy(analysis_id):
-    """Proxy download request to TradingAgents API"""
+        return jsonify_fast({"error": "Company search failed", "message": str(e)}, 500)
+
+# Endpoints forwarded by the pass-through proxy (progress list, stock info, downloads)
+# and their upstream read timeouts; any other path is not proxied
+PASSTHROUGH_TIMEOUTS = {"progress": 10, "stock-info": 10, "download": 30}
+
+@app.route('/api/<path:subpath>')
+def passthrough_proxy(subpath):
+    """Forward the remaining read-only API calls to TradingAgents API as-is"""
+    timeout = PASSTHROUGH_TIMEOUTS.get(subpath.split('/', 1)[0])
+    if timeout is None:
+        abort(404)
     try:
-        response = requests.get(f"{TRADINGAGENTS_API_URL}/api/download/{analysis_id}", timeout=30)
-        
-        # Forward the file download response
-        from flask import Response
-        return Response(
-            response.content,
-            status=response.status_code,
-            headers=dict(response.headers)
+        upstream_request = CLIENT.build_request(
+            'GET',
+            f"/api/{subpath}",
+            params=list(request.args.items(multi=True)),
+            timeout=timeout
         )
+        response = CLIENT.send(upstream_request, stream=True)
+        return stream_upstream(response)
     except Exception as e:
-        return {"error": "Download failed", "message": str(e)}, 500
+        return jsonify_fast({"error": "Upstream request failed", "message": str(e)}, 500)
 
-@app.route('/api/download/<analysis_id>/pdf')
-def download_analysis_pdf_proxy(analysis_id):
-    """Proxy PDF download request to TradingAgents API"""
+def warm_upstream():
+    """Open the upstream connection (DNS, TCP, TLS) ahead of the first page load; returns reachability"""
     try:
-        response = requests.get(f"{TRADINGAGENTS_API_URL}/api/download/{analysis_id}/pdf", timeout=30)
-        
-        # Forward the PDF download response
-        from flask import Response
-        return Response(
-            response.content,
-            status=response.status_code,
-            headers=dict(response.headers)
-        )
-    except Exception as e:
-        return {"error": "PDF download failed", "message": str(e)}, 500
+        return CLIENT.get("/api/health", timeout=5).status_code == 200
+    except httpx.HTTPError:
+        return False
 
-@app.route('/api/stock-info/<symbol>')
-def stock_info_proxy(symbol):
-    """Proxy stock info request to TradingAgents API"""
-    try:
-        response = requests.get(f"{TRADINGAGENTS_API_URL}/api/stock-info/{symbol}", timeout=10)
-        return response.json(), response.status_code
-    except Exception as e:
-        return {"error": "Stock info failed", "message": str(e)}, 500
+def run_production_server():
+    """Serve the dashboard with waitress (thread pool + inbound HTTP/1.1 keep-alive)"""
+    from waitress import serve
+    warm_upstream()
+    serve(app, host="0.0.0.0", port=DASHBOARD_PORT, threads=8, connection_limit=200, channel_timeout=120)
 
 if __name__ == "__main__":
     print(f"🚀 Starting TradingAgents Dashboard on port {DASHBOARD_PORT}...")
     print(f"📡 Connecting to TradingAgents API at: {TRADINGAGENTS_API_URL}")
     print(f"🌐 Dashboard will be available at: http://localhost:{DASHBOARD_PORT}")
     
-    app.run(host="0.0.0.0", port=DASHBOARD_PORT, debug=True)
\ No newline at end of file
+    if os.getenv("DASHBOARD_PRODUCTION", "false").lower() == "true":
+        run_production_server()
+    else:
+        # Development server; threaded so concurrent requests don't queue behind each other.
+        # Debugger and reloader only when explicitly asked for with FLASK_ENV=development
+        warm_upstream()
+        app.run(host="0.0.0.0", port=DASHBOARD_PORT, debug=os.getenv("FLASK_ENV") == "development", threaded=True)
\ No newline at end of file
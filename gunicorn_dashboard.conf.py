@@ -0,0 +1,26 @@
+"""
+Gunicorn settings for the TradingAgents dashboard
+Threaded workers so blocking upstream calls, long-polls and SSE streams don't serialize other requests
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', os.getenv('DASHBOARD_PORT', '8002'))}"
+# GUNICORN_WORKER_CLASS=gevent serves long-polls and SSE streams from greenlets instead of
+# threads (needs `pip install gevent`; the worker monkey-patches sockets before loading the app)
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+# A single worker on purpose: background analyses, their dedup map and the circuit breaker
+# live in process memory, and a progress poll answered by another worker would never see
+# a failed run. Scale with threads instead
+workers = 1
+threads = int(os.getenv("GUNICORN_THREADS", 64))
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", 1000))
+
+# An analysis request can wait on the upstream API for up to 10 minutes
+timeout = 700
+
+def post_worker_init(worker):
+    """Connect each worker to the upstream API before it takes traffic"""
+    from dashboard import warm_upstream
+    if not warm_upstream():
+        worker.log.warning("TradingAgents API not reachable at worker start")
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+TradingAgents Dashboard - Production Server
+Runs the dashboard under waitress instead of the Flask development server
+"""
+
+from dashboard import run_production_server, DASHBOARD_PORT, TRADINGAGENTS_API_URL
+
+if __name__ == "__main__":
+    print(f"🚀 Serving TradingAgents Dashboard with waitress on port {DASHBOARD_PORT}...")
+    print(f"📡 Connecting to TradingAgents API at: {TRADINGAGENTS_API_URL}")
+
+    run_production_server()
@@ -0,0 +1,772 @@
+let currentAnalysisId = null;
+let analysisInterval = null;
+
+// Element references looked up once instead of on every progress tick
+const EL = {};
+document.addEventListener('DOMContentLoaded', () => {
+    for (const id of [
+        'progressFill', 'analysisProgress', 'activeAgents', 'analyzeBtn', 'results',
+        'resultsSection', 'progressSection', 'systemStatus', 'apiStatus', 'symbol', 'date',
+        'companyInfo', 'autocomplete', 'historyContainer', 'agentStatus'
+    ]) {
+        EL[id] = document.getElementById(id);
+    }
+});
+
+const AGENTS = ['Fundamental', 'Sentiment', 'News', 'Technical', 'Bullish', 'Bearish', 'Trader'];
+
+// Shared formatter; toLocaleString() builds a new one on every call
+const dateFormatter = new Intl.DateTimeFormat(undefined, {
+    year: 'numeric', month: 'short', day: 'numeric', hour: '2-digit', minute: '2-digit'
+});
+const formattedDates = new Map();
+
+function formatTimestamp(timestamp) {
+    let formatted = formattedDates.get(timestamp);
+    if (formatted === undefined) {
+        formatted = dateFormatter.format(new Date(timestamp));
+        formattedDates.set(timestamp, formatted);
+    }
+    return formatted;
+}
+
+// Check system status on load
+window.onload = function() {
+    // Default the analysis date to today in the browser's local time zone
+    EL.date.value = new Date().toLocaleDateString('en-CA');
+    renderAgentCards();
+    // Status and history arrive together in one startup request
+    loadBootstrap();
+    setInterval(checkSystemStatus, 30000); // Check every 30 seconds (served from the 10s health cache)
+    setupAutoComplete();
+};
+
+async function loadBootstrap() {
+    try {
+        const response = await fetch('/api/bootstrap');
+        const data = await response.json();
+        updateSystemStatus(!!data.health && data.health.status === 'healthy');
+        showAnalysisHistory(data.history || {});
+    } catch (error) {
+        console.error('Bootstrap error:', error);
+        checkSystemStatus();
+        loadAnalysisHistory();
+    }
+}
+
+// Card element and its status line per agent name, filled by renderAgentCards()
+const AGENT_CARDS = {};
+
+// Build the agent grid once; cards are keyed by data-agent for direct lookup
+function renderAgentCards() {
+    const fragment = document.createDocumentFragment();
+    AGENTS.forEach(name => {
+        const card = document.createElement('div');
+        card.className = 'agent-card';
+        card.dataset.agent = name.toLowerCase();
+        card.innerHTML = `<h4>${name}</h4><p>Ready</p>`;
+        AGENT_CARDS[name] = { card, status: card.querySelector('p') };
+        fragment.appendChild(card);
+    });
+    EL.agentStatus.appendChild(fragment);
+}
+
+function setSymbol(symbol) {
+    EL.symbol.value = symbol;
+    updateCompanyInfo(symbol);
+    hideAutocomplete();
+}
+
+// Auto-complete functionality
+function setupAutoComplete() {
+    const symbolInput = EL.symbol;
+    const autocompleteDiv = EL.autocomplete;
+    let searchTimeout;
+
+    symbolInput.addEventListener('input', function() {
+        const query = this.value.trim().toUpperCase();
+        
+        // Clear previous timeout
+        if (searchTimeout) clearTimeout(searchTimeout);
+        
+        if (query.length === 0) {
+            hideAutocomplete();
+            EL.companyInfo.textContent = '';
+            return;
+        }
+
+        // Update company info for exact matches
+        updateCompanyInfo(query);
+
+        // Debounce search
+        searchTimeout = setTimeout(() => {
+            if (query.length >= 1) {
+                searchCompanies(query);
+            } else {
+                hideAutocomplete();
+            }
+        }, 300);
+    });
+
+    symbolInput.addEventListener('blur', function() {
+        // Hide autocomplete after a short delay to allow clicks
+        setTimeout(hideAutocomplete, 200);
+    });
+
+    symbolInput.addEventListener('focus', function() {
+        const query = this.value.trim().toUpperCase();
+        if (query.length >= 1) {
+            searchCompanies(query);
+        }
+    });
+}
+
+async function updateCompanyInfo(symbol) {
+    if (symbol.length === 0) {
+        EL.companyInfo.textContent = '';
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/company-info/${symbol}`);
+        const data = await response.json();
+        
+        if (data.found) {
+            EL.companyInfo.textContent = data.company_name;
+        } else {
+            EL.companyInfo.textContent = '';
+        }
+    } catch (error) {
+        EL.companyInfo.textContent = '';
+    }
+}
+
+// Only the latest autocomplete request may resolve; older ones are aborted
+let searchController = null;
+let searchSeq = 0;
+
+async function searchCompanies(query) {
+    if (searchController) searchController.abort();
+    searchController = new AbortController();
+    const mySeq = ++searchSeq;
+
+    try {
+        const response = await fetch(`/api/search-companies/${query}`, { signal: searchController.signal });
+        if (mySeq !== searchSeq) return;
+        const data = await response.json();
+        if (mySeq !== searchSeq) return;
+        // Project to a fixed shape so every match shares one hidden class
+        const matches = (data.matches || []).map(m => ({ symbol: m.symbol, company_name: m.company_name }));
+        showAutocomplete(matches);
+    } catch (error) {
+        if (error.name === 'AbortError') return;
+        console.error('Search error:', error);
+        hideAutocomplete();
+    }
+}
+
+function showAutocomplete(matches) {
+    const autocompleteDiv = EL.autocomplete;
+    
+    if (matches.length === 0) {
+        hideAutocomplete();
+        return;
+    }
+
+    autocompleteDiv.innerHTML = '';
+    matches.forEach(match => {
+        const item = document.createElement('div');
+        item.className = 'autocomplete-item';
+        item.innerHTML = `
+            <div class="autocomplete-symbol">${match.symbol}</div>
+            <div class="autocomplete-company">${match.company_name}</div>
+        `;
+        item.onclick = () => selectSymbol(match.symbol);
+        autocompleteDiv.appendChild(item);
+    });
+
+    autocompleteDiv.style.display = 'block';
+}
+
+function hideAutocomplete() {
+    EL.autocomplete.style.display = 'none';
+}
+
+function selectSymbol(symbol) {
+    EL.symbol.value = symbol;
+    updateCompanyInfo(symbol);
+    hideAutocomplete();
+}
+
+// Analysis History functionality
+async function loadAnalysisHistory() {
+    const historyContainer = EL.historyContainer;
+    historyContainer.innerHTML = '<div class="loading">Loading analysis history...</div>';
+
+    try {
+        const response = await fetch('/api/history');
+        showAnalysisHistory(await response.json());
+    } catch (error) {
+        console.error('History loading error:', error);
+        historyContainer.innerHTML = '<div class="error">Failed to load analysis history</div>';
+    }
+}
+
+function showAnalysisHistory(data) {
+    if (data.analyses && data.analyses.length > 0) {
+        displayAnalysisHistory(data.analyses);
+    } else {
+        EL.historyContainer.innerHTML =
+            '<div class="loading">No analysis history found. Run some analyses to see them here!</div>';
+    }
+}
+
+function displayAnalysisHistory(analyses) {
+    // Items are built off-DOM and inserted in one go
+    const fragment = document.createDocumentFragment();
+
+    analyses.forEach(analysis => {
+        const historyItem = document.createElement('div');
+        historyItem.className = 'history-item';
+        
+        const decision = analysis.decision || 'Unknown';
+        const decisionClass = decision.toLowerCase().includes('buy') ? 'buy' : 
+                            decision.toLowerCase().includes('sell') ? 'sell' : 
+                            decision.toLowerCase().includes('hold') ? 'hold' : '';
+        
+        const timeStr = analysis.completed_at ? formatTimestamp(analysis.completed_at) : 'Unknown time';
+        const duration = analysis.duration_formatted || 'Unknown duration';
+        
+        historyItem.innerHTML = `
+            <div class="history-header">
+                <div class="history-symbol">${analysis.symbol}</div>
+                <div class="history-decision ${decisionClass}">${decision}</div>
+            </div>
+            <div class="history-meta">
+                <div class="history-date">📅 ${timeStr}</div>
+                <div>📊 Analysis Date: ${analysis.date}</div>
+                <div class="history-duration">⏱️ Duration: ${duration}</div>
+            </div>
+            <div class="stock-metrics">
+                <div style="grid-column: 1 / -1; text-align: center; color: #666;">Loading stock data...</div>
+            </div>
+            <div class="history-actions">
+                <button class="download-btn" onclick="downloadAnalysis('${analysis.analysis_id}', '${analysis.symbol}')">
+                    📄 Text
+                </button>
+                <button class="download-btn pdf-btn" onclick="downloadAnalysisPDF('${analysis.analysis_id}', '${analysis.symbol}')">
+                    📑 PDF
+                </button>
+            </div>
+        `;
+
+        historyItem.onclick = () => viewHistoryDetails(analysis);
+        fragment.appendChild(historyItem);
+        
+        // Fetch stock data for this symbol straight into the item's metrics box
+        fetchStockMetrics(analysis.symbol, historyItem.querySelector('.stock-metrics'));
+    });
+
+    EL.historyContainer.replaceChildren(fragment);
+}
+
+async function fetchStockMetrics(symbol, metricsContainer) {
+    try {
+        const response = await fetch(`/api/stock-info/${symbol}`);
+        const stockData = await response.json();
+        
+        if (response.ok && !stockData.error) {
+            displayStockMetrics(stockData, metricsContainer);
+        } else {
+            displayStockError(symbol, metricsContainer);
+        }
+    } catch (error) {
+        console.error(`Error fetching stock data for ${symbol}:`, error);
+        displayStockError(symbol, metricsContainer);
+    }
+}
+
+function displayStockMetrics(stock, metricsContainer) {
+    
+    const changeClass = stock.day_change_pct >= 0 ? 'positive' : 'negative';
+    const changeIcon = stock.day_change_pct >= 0 ? '📈' : '📉';
+    
+    metricsContainer.innerHTML = `
+        <div class="metric-item" style="grid-column: 1 / -1;">
+            <span class="metric-label">💰 Current Price:</span>
+            <span class="metric-value price-main ${changeClass}">$${stock.current_price || 'N/A'} ${changeIcon} ${stock.day_change_pct || 0}%</span>
+        </div>
+        <div class="metric-item">
+            <span class="metric-label">📊 P/E Ratio:</span>
+            <span class="metric-value">${stock.pe_ratio || 'N/A'}</span>
+        </div>
+        <div class="metric-item">
+            <span class="metric-label">🏢 Market Cap:</span>
+            <span class="metric-value">${stock.market_cap || 'N/A'}</span>
+        </div>
+        <div class="metric-item">
+            <span class="metric-label">📈 52W High:</span>
+            <span class="metric-value">$${stock.fifty_two_week_high || 'N/A'}</span>
+        </div>
+        <div class="metric-item">
+            <span class="metric-label">📉 52W Low:</span>
+            <span class="metric-value">$${stock.fifty_two_week_low || 'N/A'}</span>
+        </div>
+        <div class="metric-item">
+            <span class="metric-label">📊 Volume:</span>
+            <span class="metric-value">${stock.volume || 'N/A'}</span>
+        </div>
+        ${stock.dividend_yield ? `<div class="metric-item">
+            <span class="metric-label">💵 Dividend:</span>
+            <span class="metric-value">${stock.dividend_yield}%</span>
+        </div>` : ''}
+    `;
+}
+
+function displayStockError(symbol, metricsContainer) {
+    
+    metricsContainer.innerHTML = `
+        <div style="grid-column: 1 / -1; text-align: center; color: #dc3545; font-size: 0.8em;">
+            ⚠️ Stock data unavailable for ${symbol}
+        </div>
+    `;
+}
+
+function viewHistoryDetails(analysis) {
+    // Re-run analysis for this symbol and date
+    EL.symbol.value = analysis.symbol;
+    EL.date.value = analysis.date;
+    updateCompanyInfo(analysis.symbol);
+    
+    // Scroll to top
+    window.scrollTo({ top: 0, behavior: 'smooth' });
+    
+    // Optionally show a message
+    const analysisProgress = EL.analysisProgress;
+    if (analysisProgress) {
+        analysisProgress.textContent = `Click "Start Analysis" to re-run analysis for ${analysis.symbol}`;
+    }
+}
+
+const HEALTHY_PATTERN = /"status"\s*:\s*"healthy"/;
+
+async function checkSystemStatus() {
+    try {
+        const response = await fetch('/api/health');
+        // Only the status field is needed; skip the generic JSON parse
+        updateSystemStatus(HEALTHY_PATTERN.test(await response.text()));
+    } catch (error) {
+        console.error('💥 API Error:', error);
+        EL.systemStatus.innerHTML = 
+            '<span class="status-indicator status-error"></span>Connection Failed';
+        EL.apiStatus.innerHTML = 
+            '<span class="status-indicator status-error"></span>API Offline';
+    }
+}
+
+function updateSystemStatus(healthy) {
+    if (healthy) {
+        EL.systemStatus.innerHTML = 
+            '<span class="status-indicator status-healthy"></span>System Healthy';
+        EL.apiStatus.innerHTML = 
+            '<span class="status-indicator status-healthy"></span>API Connected';
+    } else {
+        EL.systemStatus.innerHTML = 
+            '<span class="status-indicator status-error"></span>System Error';
+        EL.apiStatus.innerHTML = 
+            '<span class="status-indicator status-error"></span>API Error';
+    }
+}
+
+// Values last written to the DOM, so unchanged progress updates skip the writes
+let lastProgress = {};
+// Progress messages received so far; the server only sends the ones past message_offset
+let progressMessages = [];
+let progressPolling = false;
+let progressPollTimer = null;
+let progressVersion = '';
+let progressFailures = 0;
+
+async function startAnalysis(event) {
+    event.preventDefault();
+    
+    const symbol = EL.symbol.value.toUpperCase();
+    const date = EL.date.value;
+    
+    if (!symbol) {
+        alert('Please enter a stock symbol');
+        return;
+    }
+
+    // Show progress section
+    EL.progressSection.style.display = 'block';
+    EL.resultsSection.style.display = 'none';
+    
+    // Update UI
+    const analyzeBtn = EL.analyzeBtn;
+    analyzeBtn.disabled = true;
+    analyzeBtn.textContent = '🔄 Analyzing...';
+    analyzeBtn.classList.add('pulse');
+    
+    EL.analysisProgress.textContent = `Analyzing ${symbol}...`;
+    EL.activeAgents.textContent = 'Initializing agents...';
+    
+    // Reset progress
+    EL.progressFill.style.width = '5%';
+    
+    try {
+        const response = await fetch('/api/analyze', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ symbol, date }),
+        });
+        
+        // Check if response is actually JSON
+        const contentType = response.headers.get('content-type');
+        if (!contentType || !contentType.includes('application/json')) {
+            const responseText = await response.text();
+            showError(`Server returned non-JSON response: ${responseText.substring(0, 200)}...`);
+            return;
+        }
+        
+        const result = await response.json();
+        
+        if (result.error) {
+            showError(result.message || 'Analysis failed');
+            resetAnalyzeButton();
+        } else if (result.status === 'started') {
+            // Store analysis ID and start progress tracking for async analysis
+            currentAnalysisId = result.analysis_id;
+            startRealTimeProgress();
+        } else {
+            // The analysis result only ever arrives through the progress stream
+            showError(result.message || 'Unexpected response from the analysis service');
+            resetAnalyzeButton();
+        }
+    } catch (error) {
+        console.error('Analysis error:', error);
+        if (error.message.includes('Unexpected token') || error.message.includes('JSON') || error.message.includes('Expecting value')) {
+            showError('Server returned invalid response. The API service may be starting up or experiencing issues. Please wait a moment and try again.');
+        } else {
+            showError('Network error: ' + error.message);
+        }
+        
+        // Reset button on error
+        resetAnalyzeButton();
+        
+        // Stop progress tracking on error
+        stopProgressTracking();
+    }
+}
+
+let progressStream = null;
+
+function startRealTimeProgress() {
+    if (!currentAnalysisId) {
+        return;
+    }
+    
+    lastProgress = {};
+    progressMessages = [];
+    
+    if (typeof EventSource === 'undefined') {
+        startProgressPolling();
+        return;
+    }
+    
+    // Server pushes an event only when the progress payload changes
+    progressStream = new EventSource(`/api/progress/${currentAnalysisId}/stream`);
+    progressStream.onmessage = (event) => {
+        handleProgressUpdate(JSON.parse(event.data));
+    };
+    progressStream.onerror = () => {
+        stopProgressTracking();
+        startProgressPolling();
+    };
+}
+
+function startProgressPolling() {
+    progressPolling = true;
+    progressVersion = '';
+    progressFailures = 0;
+    pollProgress();
+}
+
+// Retry delay after consecutive failures: 2s, 4s, 8s, then 16s, plus jitter so
+// many open dashboards don't retry against a struggling upstream in lockstep
+function progressRetryDelay() {
+    progressFailures++;
+    return Math.min(16000, 2000 * 2 ** (progressFailures - 1)) + Math.random() * 500;
+}
+
+// Long-poll: the server holds the request until progress moves past progressVersion
+async function pollProgress() {
+    if (!progressPolling) return;
+    let delay = 0;
+    
+    try {
+        const response = await fetch(`/api/progress/${currentAnalysisId}?wait=25&since=${progressVersion}&since_msg=${progressMessages.length}`);
+        
+        if (response.status === 204) {
+            // Nothing changed within the wait window; ask again right away
+            progressFailures = 0;
+        } else if (response.ok) {
+            // Check if response is actually JSON
+            const contentType = response.headers.get('content-type');
+            if (!contentType || !contentType.includes('application/json')) {
+                console.warn('⚠️ Progress endpoint returned non-JSON response');
+                delay = progressRetryDelay();
+            } else {
+                const progressData = await response.json();
+                progressFailures = 0;
+                progressVersion = progressData.version || '';
+                handleProgressUpdate(progressData);
+            }
+        } else {
+            // Keep existing fake progress as fallback
+            useFallbackProgress();
+            delay = progressRetryDelay();
+        }
+    } catch (error) {
+        console.error('❌ Progress polling error:', error);
+        // Keep existing fake progress as fallback
+        useFallbackProgress();
+        delay = progressRetryDelay();
+    }
+    
+    if (progressPolling) {
+        progressPollTimer = setTimeout(pollProgress, delay);
+    }
+}
+
+function stopProgressTracking() {
+    progressPolling = false;
+    if (progressPollTimer) {
+        clearTimeout(progressPollTimer);
+        progressPollTimer = null;
+    }
+    if (progressStream) {
+        progressStream.close();
+        progressStream = null;
+    }
+}
+
+function handleProgressUpdate(progressData) {
+    // Update progress bar
+    const progress = progressData.progress || 0;
+    if (progress !== lastProgress.progress) {
+        EL.progressFill.style.width = progress + '%';
+    }
+    
+    // Update status messages
+    const status = progressData.status || 'unknown';
+    const currentAgent = progressData.current_agent || 'System';
+    if (progressData.messages) {
+        const offset = progressData.message_offset || 0;
+        if (offset === 0) {
+            // Full list (first update, final state or a replaced list): take it as-is
+            progressMessages = progressData.messages.slice();
+        } else {
+            progressMessages.length = Math.min(progressMessages.length, offset);
+            progressMessages.push(...progressData.messages);
+        }
+    }
+    const messages = progressMessages;
+    
+    const statusText = messages.length > 0 ? messages[messages.length - 1] : `Status: ${status}`;
+    if (statusText !== lastProgress.statusText) {
+        EL.analysisProgress.textContent = statusText;
+    }
+    const agentsText = `${currentAgent} (${progress}%)`;
+    if (agentsText !== lastProgress.agentsText) {
+        EL.activeAgents.textContent = agentsText;
+    }
+    
+    // Update individual agent cards only when the active agent changes
+    if (currentAgent !== lastProgress.currentAgent) {
+        updateAgentCards(progress, currentAgent);
+    }
+    
+    lastProgress = { progress, statusText, agentsText, currentAgent };
+    
+    if (status === 'failed' || status === 'timeout') {
+        stopProgressTracking();
+        showError(messages.length > 0 ? messages[messages.length - 1] : `Analysis ${status}`);
+        
+        resetAnalyzeButton();
+        return;
+    }
+    
+    // Stop tracking when complete
+    if (status === 'completed' || progress >= 100) {
+        stopProgressTracking();
+        
+        // Update final status
+        EL.analysisProgress.textContent = '✅ Analysis Complete';
+        EL.activeAgents.textContent = 'All agents finished';
+        EL.progressFill.style.width = '100%';
+        
+        // Reset all agent cards to Ready state
+        resetAgentCards();
+        
+        // Show results from progress data
+        if (progressData.result && progressData.decision) {
+            const result = {
+                analysis_id: currentAnalysisId,
+                symbol: progressData.symbol,
+                analysis_date: progressData.date,
+                decision: progressData.decision,
+                result: progressData.result,
+                timestamp: progressData.completed_at,
+                status: 'completed'
+            };
+            showResults(result);
+        }
+        
+        // Reset button
+        resetAnalyzeButton();
+    }
+}
+
+// Upstream agent names mapped to the card that represents them
+const AGENT_CARD_NAMES = {
+    'Fundamental': 'Fundamental',
+    'Sentiment': 'Sentiment', 
+    'News': 'News',
+    'Technical': 'Technical',
+    'Bullish': 'Bullish',
+    'Bearish': 'Bearish',
+    'Trading Decision Maker': 'Trader',
+    'Multi-Agent System': 'Fundamental' // Default to first agent
+};
+
+function resetAgentCards() {
+    for (const { card, status } of Object.values(AGENT_CARDS)) {
+        card.classList.remove('active');
+        status.textContent = 'Ready';
+    }
+}
+
+function updateAgentCards(progress, currentAgent) {
+    resetAgentCards();
+    
+    // Highlight current active agent
+    const active = AGENT_CARDS[AGENT_CARD_NAMES[currentAgent] || 'Fundamental'];
+    if (active) {
+        active.card.classList.add('active');
+        active.status.textContent = 'Working...';
+    }
+}
+
+function useFallbackProgress() {
+    // Fallback fake progress if real progress fails; it writes the DOM directly,
+    // so the next real update must not be skipped as unchanged
+    lastProgress = {};
+    let progressStep = parseInt(EL.progressFill.style.width) || 10;
+    const maxProgress = 95;
+    
+    if (progressStep < maxProgress) {
+        progressStep += Math.random() * 3; // Slower increment
+        if (progressStep > maxProgress) progressStep = maxProgress;
+        
+        EL.progressFill.style.width = progressStep + '%';
+        
+        // Generic status messages
+        if (progressStep < 30) {
+            EL.analysisProgress.textContent = '🚀 Analysis in progress...';
+        } else if (progressStep < 60) {
+            EL.analysisProgress.textContent = '📊 Agents analyzing data...';
+        } else if (progressStep < 85) {
+            EL.analysisProgress.textContent = '🤔 Final decision making...';
+        }
+    }
+}
+
+
+function resetAnalyzeButton() {
+    EL.analyzeBtn.disabled = false;
+    EL.analyzeBtn.textContent = '🔍 Start Analysis';
+    EL.analyzeBtn.classList.remove('pulse');
+}
+
+function showResults(result) {
+    EL.resultsSection.style.display = 'block';
+    
+    // Reset all agent cards to Ready state when showing results
+    resetAgentCards();
+    
+    let decisionClass = 'decision-card';
+    if (result.decision && result.decision.toLowerCase().includes('sell')) {
+        decisionClass += ' sell';
+    } else if (result.decision && result.decision.toLowerCase().includes('hold')) {
+        decisionClass += ' hold';
+    }
+    
+    const resultsHtml = `
+        <div class="${decisionClass}">
+            <h3>🎯 Trading Decision</h3>
+            <div style="font-size: 1.5em; margin-top: 10px;">
+                ${result.decision || 'Analysis Complete'}
+            </div>
+        </div>
+        
+        <div style="margin-bottom: 20px;">
+            <strong>Symbol:</strong> ${result.symbol}<br>
+            <strong>Analysis Date:</strong> ${result.analysis_date}<br>
+            <strong>Completed:</strong> ${new Date(result.timestamp).toLocaleString()}<br>
+            <strong>Status:</strong> ${result.status}
+        </div>
+        
+        <h3>📋 Detailed Analysis</h3>
+        <div class="analysis-details">${result.result || 'No detailed results available'}</div>
+    `;
+    
+    EL.results.innerHTML = resultsHtml;
+    EL.analysisProgress.textContent = 'Analysis Complete';
+}
+
+function showError(message) {
+    EL.resultsSection.style.display = 'block';
+    
+    // Reset all agent cards to Ready state on error
+    resetAgentCards();
+    
+    EL.results.innerHTML = `
+        <div class="error">
+            <h3>❌ Analysis Error</h3>
+            <p>${message}</p>
+        </div>
+    `;
+    EL.analysisProgress.textContent = 'Analysis Failed';
+    EL.activeAgents.textContent = '0 / 7 agents';
+}
+
+// Download analysis summary (text)
+function downloadAnalysis(analysisId, symbol) {
+    event.stopPropagation(); // Prevent triggering the history item click
+    
+    // Create download link
+    const downloadUrl = `/api/download/${analysisId}`;
+    const link = document.createElement('a');
+    link.href = downloadUrl;
+    link.download = `analysis_${symbol}_${analysisId}.txt`;
+    document.body.appendChild(link);
+    link.click();
+    document.body.removeChild(link);
+}
+
+// Download analysis summary (PDF)
+function downloadAnalysisPDF(analysisId, symbol) {
+    event.stopPropagation(); // Prevent triggering the history item click
+    
+    // Create download link
+    const downloadUrl = `/api/download/${analysisId}/pdf`;
+    const link = document.createElement('a');
+    link.href = downloadUrl;
+    link.download = `analysis_${symbol}_${analysisId}.pdf`;
+    document.body.appendChild(link);
+    link.click();
+    document.body.removeChild(link);
+}